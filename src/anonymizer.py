@@ -5,8 +5,12 @@ Applies anonymization strategies to DataFrames based on configuration rules.
 Preserves data types, handles missing values, and maintains data utility where possible.
 """
 
-from typing import Any, Dict, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import hashlib
+import os
+import threading
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -37,8 +41,110 @@ class AnonymizationStrategies:
     # Cache for Faker instances (keyed by locale)
     _faker_cache: Dict[str, Any] = {}
 
-    # Cache for pseudonymization mappings (for consistency)
-    _pseudo_cache: Dict[tuple, Any] = {}
+    # Serializes creating, seeding and drawing from the shared Faker instances
+    _faker_lock = threading.RLock()
+
+    # Maximum number of seed-based pseudonyms remembered (LRU)
+    PSEUDONYM_CACHE_SIZE = 100_000
+
+    # Supported hash algorithms (hashlib constructors). blake2b is ~3x faster
+    # than sha256 in software with the same 64-char output; prefer sha256
+    # where the hash must resist attackers with established tooling.
+    _hash_algorithms: Dict[str, Callable] = {
+        "sha256": hashlib.sha256,
+        "sha512": hashlib.sha512,
+        "blake2b": functools.partial(hashlib.blake2b, digest_size=32),
+        "md5": hashlib.md5,
+    }
+
+    @staticmethod
+    def _map_non_null(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+        """
+        Apply func to the non-null values of a column, keeping nulls as-is.
+
+        Args:
+            series: Column to transform
+            func: Function applied to each non-null value
+
+        Returns:
+            Transformed series with the same index and name
+        """
+        mask = series.notna().to_numpy()
+        values = series.to_numpy(dtype=object)[mask]
+        replacements = [func(value) for value in values]
+        return AnonymizationStrategies._replace_non_null(series, mask, replacements)
+
+    @staticmethod
+    def _replace_non_null(
+        series: pd.Series, mask: np.ndarray, replacements: Any
+    ) -> pd.Series:
+        """
+        Build a column from series with the masked (non-null) entries replaced.
+
+        The output array is allocated once; only the null entries are copied
+        over from the original column.
+
+        Args:
+            series: Original column (for index, name and null values)
+            mask: Boolean mask of non-null positions
+            replacements: New values for the masked positions, in order
+
+        Returns:
+            New series with the same index and name
+        """
+        result = np.empty(len(mask), dtype=object)
+        result[mask] = replacements
+        if not mask.all():
+            result[~mask] = np.asarray(series.array[~mask], dtype=object)
+        return pd.Series(result, index=series.index, name=series.name)
+
+    @staticmethod
+    def _hash_strings(strings: List[str], parameters: Dict[str, Any]) -> List[str]:
+        """
+        Hash a batch of strings as described by the parameters.
+
+        The algorithm is resolved once and each string is encoded and hashed
+        in a single tight loop.
+
+        Args:
+            strings: String forms of the values to hash
+            parameters: Must contain 'algorithm', optional 'salt'
+
+        Returns:
+            Hexadecimal hash strings, in input order
+
+        Raises:
+            AnonymizationError: If the algorithm is not supported
+        """
+        algorithm = parameters.get("algorithm", "sha256")
+        hash_ctor = AnonymizationStrategies._hash_algorithms.get(algorithm)
+        if hash_ctor is None:
+            raise AnonymizationError(f"Unsupported hash algorithm: {algorithm}")
+
+        # Copying an empty prototype context is cheaper than constructing a
+        # new one per value (no digest lookup or keyword parsing)
+        hash_base = hash_ctor()
+        hashes = []
+
+        if not parameters.get("salt", False):
+            for string in strings:
+                hasher = hash_base.copy()
+                hasher.update(string.encode())
+                hashes.append(hasher.hexdigest())
+            return hashes
+
+        # The salt depends on the value, so no prefix can be pre-hashed
+        md5_base = hashlib.md5()
+        for string in strings:
+            data = string.encode()
+            # Use a deterministic salt based on value for consistency
+            md5 = md5_base.copy()
+            md5.update(data)
+            hasher = hash_base.copy()
+            hasher.update(md5.hexdigest()[:8].encode())
+            hasher.update(data)
+            hashes.append(hasher.hexdigest())
+        return hashes
 
     @staticmethod
     def hash_strategy(value: Any, parameters: Dict[str, Any]) -> str:
@@ -55,26 +161,38 @@ class AnonymizationStrategies:
         if pd.isna(value):
             return value
 
-        # Convert to string for hashing
-        str_value = str(value)
+        return AnonymizationStrategies._hash_strings([str(value)], parameters)[0]
+
+    @staticmethod
+    def hash_series(series: pd.Series, parameters: Dict[str, Any]) -> pd.Series:
+        """
+        Hash a whole column; column-level equivalent of hash_strategy.
 
-        # Add salt if specified
-        if parameters.get("salt", False):
-            # Use a determinstic salt based on value for consistency
-            salt = hashlib.md5(str_value.encode()).hexdigest()[:8]
-            str_value = f"{salt}{str_value}"
+        Nulls are masked once and the non-null values are hashed as one
+        batch; string columns skip the per-value str() conversion.
 
-        # Select algorithm
-        algorithm = parameters.get("algorithm", "sha256")
+        Args:
+            series: Column to hash
+            parameters: Must contain 'algorithm', optional 'salt'
 
-        if algorithm == "sha256":
-            return hashlib.sha256(str_value.encode()).hexdigest()
-        elif algorithm == "sha512":
-            return hashlib.sha512(str_value.encode()).hexdigest()
-        elif algorithm == "md5":
-            return hashlib.md5(str_value.encode()).hexdigest()
+        Returns:
+            Series of hexadecimal hash strings (nulls preserved)
+        """
+        mask = series.notna().to_numpy()
+        if not mask.any():
+            return series.copy()
+
+        non_null = series.to_numpy(dtype=object)[mask]
+        if isinstance(series.dtype, pd.StringDtype):
+            strings = non_null.tolist()
         else:
-            raise AnonymizationError(f"Unsupported hash algorithm: {algorithm}")
+            strings = [str(value) for value in non_null]
+
+        return AnonymizationStrategies._replace_non_null(
+            series,
+            mask,
+            AnonymizationStrategies._hash_strings(strings, parameters),
+        )
 
     @staticmethod
     def redact_full_strategy(value: Any, parameters: Dict[str, Any]) -> str:
@@ -93,6 +211,28 @@ class AnonymizationStrategies:
 
         return parameters.get("replacement", "[REDACTED]")
 
+    @staticmethod
+    def redact_full_series(series: pd.Series, parameters: Dict[str, Any]) -> pd.Series:
+        """
+        Completely redact a whole column; column-level redact_full_strategy.
+
+        Every non-null entry references the same replacement object, so the
+        output holds one string however long the column is.
+
+        Args:
+            series: Column to redact
+            parameters: Must contain 'replacement'
+
+        Returns:
+            Series of replacement strings (nulls preserved)
+        """
+        mask = series.notna().to_numpy()
+        if not mask.any():
+            return series.copy()
+
+        replacement = parameters.get("replacement", "[REDACTED]")
+        return AnonymizationStrategies._replace_non_null(series, mask, replacement)
+
     @staticmethod
     def redact_partial_strategy(value: Any, parameters: Dict[str, Any]) -> str:
         """
@@ -108,19 +248,55 @@ class AnonymizationStrategies:
         if pd.isna(value):
             return value
 
-        str_value = str(value)
+        return AnonymizationStrategies._get_partial_redactor(parameters)(value)
+
+    @staticmethod
+    def _get_partial_redactor(parameters: Dict[str, Any]) -> Callable[[Any], str]:
+        """
+        Build the partial redaction function described by the parameters.
+
+        Args:
+            parameters: Must contain 'visible_chars' and 'mask_char'
+
+        Returns:
+            Function mapping a non-null value to its partially masked string
+        """
         visible_chars = parameters.get("visible_chars", 0)
         mask_char = parameters.get("mask_char", "*")
 
         if visible_chars <= 0:
-            return mask_char * len(str_value)
+            return lambda value: mask_char * len(str(value))
 
-        if visible_chars >= len(str_value):
-            return str_value
+        def redact(value: Any) -> str:
+            str_value = str(value)
+            masked_length = len(str_value) - visible_chars
+            if masked_length <= 0:
+                return str_value
 
-        # Keep last N characters visible
-        masked_length = len(str_value) - visible_chars
-        return (mask_char * masked_length) + str_value[-visible_chars:]
+            # Keep last N characters visible
+            return (mask_char * masked_length) + str_value[-visible_chars:]
+
+        return redact
+
+    @staticmethod
+    def redact_partial_series(
+        series: pd.Series, parameters: Dict[str, Any]
+    ) -> pd.Series:
+        """
+        Partially redact a whole column; column-level redact_partial_strategy.
+
+        Args:
+            series: Column to partially redact
+            parameters: Must contain 'visible_chars' and 'mask_char'
+
+        Returns:
+            Series of partially masked strings (nulls preserved)
+        """
+        if not series.notna().any():
+            return series.copy()
+
+        redact = AnonymizationStrategies._get_partial_redactor(parameters)
+        return AnonymizationStrategies._map_non_null(series, redact)
 
     @staticmethod
     def pseudonymize_strategy(value: Any, parameters: Dict[str, Any]) -> Any:
@@ -132,9 +308,10 @@ class AnonymizationStrategies:
             parameters: Must contain 'seed_based', optional 'locale'
 
         Returns:
-            Fake value (same type if possible)
+            Fake value (same type if possible); empty strings are returned
+            unchanged since they carry nothing to pseudonymize
         """
-        if pd.isna(value):
+        if pd.isna(value) or (isinstance(value, str) and not value):
             return value
 
         if Faker is None:
@@ -146,32 +323,117 @@ class AnonymizationStrategies:
         seed_based = parameters.get("seed_based", True)
         locale = parameters.get("locale", "en_US")
 
-        # Get or create Faker instance
-        if locale not in AnonymizationStrategies._faker_cache:
-            AnonymizationStrategies._faker_cache[locale] = Faker(locale)
+        if seed_based:
+            # Same input -> same output, memoized per (value, locale)
+            return AnonymizationStrategies._seeded_pseudonym(str(value), locale)
+        else:
+            # Non-deterministic pseudonymization
+            faker = AnonymizationStrategies._get_faker(locale)
+            with AnonymizationStrategies._faker_lock:
+                return faker.name()
 
-        faker = AnonymizationStrategies._faker_cache[locale]
+    @staticmethod
+    def pseudonymize_series(series: pd.Series, parameters: Dict[str, Any]) -> pd.Series:
+        """
+        Pseudonymize a whole column; column-level pseudonymize_strategy.
 
-        if seed_based:
-            # Use value as seed for consistency (same input -> same output)
-            cache_key = (locale, str(value))
+        With seed_based, values are factorized first so Faker runs once per
+        distinct value rather than once per row.
 
-            if cache_key in AnonymizationStrategies._pseudo_cache:
-                return AnonymizationStrategies._pseudo_cache[cache_key]
+        Args:
+            series: Column to pseudonymize
+            parameters: Must contain 'seed_based', optional 'locale'
 
-            # Create deterministic seed from value
-            seed = int(hashlib.md5(str(value).encode()).hexdigest(), 16) % (2**32)
-            faker.seed_instance(seed)
+        Returns:
+            Series of fake values (nulls and empty strings preserved)
+        """
+        mask = series.notna().to_numpy()
+        if not mask.any():
+            return series.copy()
 
-            # Generate fake value (use name as default)
-            fake_value = faker.name()
+        if Faker is None:
+            raise AnonymizationError(
+                "Faker library required for pseudonymization. "
+                "Install with: pip install faker"
+            )
 
-            # Cache for consistency
-            AnonymizationStrategies._pseudo_cache[cache_key] = fake_value
+        seed_based = parameters.get("seed_based", True)
+        locale = parameters.get("locale", "en_US")
+        values = series.to_numpy(dtype=object)[mask]
 
-            return fake_value
+        if seed_based:
+            keys = np.array([str(value) for value in values], dtype=object)
+            codes, uniques = pd.factorize(keys)
+            names = np.array(
+                [
+                    AnonymizationStrategies._seeded_pseudonym(key, locale)
+                    for key in uniques
+                ],
+                dtype=object,
+            )
+            replacements = names[codes]
+            # Empty strings stay as-is (see pseudonymize_strategy)
+            for i in np.flatnonzero(keys == ""):
+                if isinstance(values[i], str):
+                    replacements[i] = values[i]
         else:
-            # Non-deterministic pseudonymization
+            # Non-deterministic: a fresh name per row, drawn in one batch
+            faker = AnonymizationStrategies._get_faker(locale)
+            with AnonymizationStrategies._faker_lock:
+                replacements = [
+                    value if isinstance(value, str) and not value else faker.name()
+                    for value in values
+                ]
+
+        return AnonymizationStrategies._replace_non_null(series, mask, replacements)
+
+    @staticmethod
+    def _get_faker(locale: str) -> Any:
+        """
+        Get or create the shared Faker instance for a locale.
+
+        Args:
+            locale: Faker locale (e.g. 'en_US')
+
+        Returns:
+            Faker instance
+        """
+        faker = AnonymizationStrategies._faker_cache.get(locale)
+        if faker is None:
+            # Construct each locale once, even when columns race to create it
+            with AnonymizationStrategies._faker_lock:
+                faker = AnonymizationStrategies._faker_cache.get(locale)
+                if faker is None:
+                    faker = Faker(locale)
+                    AnonymizationStrategies._faker_cache[locale] = faker
+
+        return faker
+
+    @staticmethod
+    @functools.lru_cache(maxsize=PSEUDONYM_CACHE_SIZE)
+    def _seeded_pseudonym(value: str, locale: str) -> str:
+        """
+        Generate the deterministic fake name for a value.
+
+        Results are memoized; clear with _seeded_pseudonym.cache_clear().
+
+        Args:
+            value: String form of the original value
+            locale: Faker locale
+
+        Returns:
+            Fake name
+        """
+        faker = AnonymizationStrategies._get_faker(locale)
+
+        # Create deterministic seed from value
+        seed = int(hashlib.md5(value.encode()).hexdigest(), 16) % (2**32)
+
+        # Seed and draw atomically; the Faker instance is shared across threads
+        with AnonymizationStrategies._faker_lock:
+            faker.seed_instance(seed)
+
+            # Generate fake value (use name as default)
             return faker.name()
 
     @staticmethod
@@ -189,12 +451,7 @@ class AnonymizationStrategies:
         if pd.isna(value):
             return value
 
-        try:
-            numeric_value = float(value)
-        except (ValueError, TypeError):
-            raise AnonymizationError(
-                f"Generalization requires numeric value, got: {type(value)}"
-            )
+        numeric_value = AnonymizationStrategies._to_float(value)
 
         bin_size = parameters.get("bin_size")
         min_value = parameters.get("min_value")
@@ -215,6 +472,84 @@ class AnonymizationStrategies:
 
         return f"{int(bin_start)}-{int(bin_end)}"
 
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """
+        Convert a value to float for generalization.
+
+        Args:
+            value: Value to convert
+
+        Returns:
+            Float value
+
+        Raises:
+            AnonymizationError: If the value is not numeric
+        """
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            raise AnonymizationError(
+                f"Generalization requires numeric value, got: {type(value)}"
+            )
+
+    @staticmethod
+    def generalize_series(series: pd.Series, parameters: Dict[str, Any]) -> pd.Series:
+        """
+        Generalize a whole column; column-level equivalent of generalize_strategy.
+
+        Clamping and binning run as NumPy array operations and each distinct
+        range label is formatted once.
+
+        Args:
+            series: Numeric column to generalize
+            parameters: Must contain 'bin_size', 'min_value', 'max_value'
+
+        Returns:
+            Series of range strings (nulls preserved)
+        """
+        mask = series.notna().to_numpy()
+        if not mask.any():
+            return series.copy()
+
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            numeric = series.to_numpy(dtype=float, na_value=np.nan)[mask]
+        else:
+            numeric = np.array(
+                [
+                    AnonymizationStrategies._to_float(v)
+                    for v in series.to_numpy(dtype=object)[mask]
+                ],
+                dtype=float,
+            )
+
+        bin_size = parameters.get("bin_size")
+        min_value = parameters.get("min_value")
+        max_value = parameters.get("max_value")
+
+        # Clamp to range (fmin/fmax mirror Python's min/max on NaN)
+        clamped = np.fmax(min_value, np.fmin(max_value, numeric))
+
+        # Calculate bins
+        bin_index = np.trunc((clamped - min_value) / bin_size)
+        bin_start = min_value + bin_index * bin_size
+        bin_end = bin_start + bin_size - 1
+
+        # Handle edge case for maximum value
+        at_max = clamped == max_value
+        bin_start = np.where(at_max, max_value - bin_size + 1, bin_start)
+        bin_end = np.where(at_max, max_value, bin_end)
+
+        bounds = np.column_stack([np.trunc(bin_start), np.trunc(bin_end)])
+        unique_bounds, inverse = np.unique(bounds, axis=0, return_inverse=True)
+        labels = np.array(
+            [f"{int(start)}-{int(end)}" for start, end in unique_bounds.tolist()],
+            dtype=object,
+        )
+        return AnonymizationStrategies._replace_non_null(
+            series, mask, labels[inverse.reshape(-1)]
+        )
+
 
 class Anonymizer:
     """
@@ -233,16 +568,41 @@ class Anonymizer:
         AnonymizationStrategy.GENERALIZE: AnonymizationStrategies.generalize_strategy,
     }
 
-    def __init__(self, config: ConfigLoader):
+    # Column-level implementations, used instead of per-value apply when present
+    _series_strategy_map: Dict[AnonymizationStrategy, Callable] = {
+        AnonymizationStrategy.HASH: AnonymizationStrategies.hash_series,
+        AnonymizationStrategy.REDACT_FULL: AnonymizationStrategies.redact_full_series,
+        AnonymizationStrategy.REDACT_PARTIAL: AnonymizationStrategies.redact_partial_series,
+        AnonymizationStrategy.PSEUDONYMIZE: AnonymizationStrategies.pseudonymize_series,
+        AnonymizationStrategy.GENERALIZE: AnonymizationStrategies.generalize_series,
+    }
+
+    # Minimum rows before columns are anonymized concurrently; below this the
+    # thread pool costs more than it saves
+    PARALLEL_MIN_ROWS = 10_000
+
+    def __init__(self, config: ConfigLoader, max_workers: Optional[int] = None):
         """
         Initialize anonymizer with configuration.
 
         Args:
             config: Loaded ConfigLoader instance
+            max_workers: Maximum threads used to anonymize columns concurrently
+                         (default: number of CPUs; 1 disables threading)
         """
         self.config = config
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.global_config = config.get_global_config()
 
+        # Resolve each rule to its column transform once, up front. Rules
+        # with unknown strategies are left out and fail when first applied.
+        self._rules = config.get_all_rules()
+        self._compiled_rules: Dict[str, Callable[[pd.Series], pd.Series]] = {
+            pii_type: self._compile_rule(rule)
+            for pii_type, rule in self._rules.items()
+            if rule.strategy in self._strategy_map
+        }
+
         # Statistics tracking
         self._stats = {
             "columns_processed": 0,
@@ -269,11 +629,14 @@ class Anonymizer:
         Raises:
             AnonymizationError: If anonymization fails
         """
-        # Create a copy to avoid modifying original
-        result = df.copy()
-
-        # Reset statistics
-        self._stats = {
+        # Shallow copy: under pandas copy-on-write, replacing a column never
+        # touches the original, and columns without rules are not duplicated
+        result = df.copy(deep=False)
+
+        # Statistics for this run are collected locally and published when it
+        # ends, so concurrent calls on a shared instance (see the module-level
+        # anonymize helper) never write to the same dict
+        stats = {
             "columns_processed": 0,
             "columns_anonymized": 0,
             "rows_processed": len(df),
@@ -282,11 +645,13 @@ class Anonymizer:
 
         # Handle edge case: empty DataFrame
         if len(df) == 0:
+            self._stats = stats
             return result
 
-        # Process each column
+        # Find the columns to anonymize
+        jobs = []
         for column in df.columns:
-            self._stats["columns_processed"] += 1
+            stats["columns_processed"] += 1
 
             # Determine PII type for this column
             pii_type = self._get_pii_type(column, column_mapping)
@@ -296,26 +661,48 @@ class Anonymizer:
                 continue
 
             # Get rule for this PII type
-            rule = self.config.get_rule(pii_type)
+            rule = self._rules.get(pii_type)
 
             if rule is None:
                 # No rule configured, skip
                 continue
 
-            try:
-                # Anonymize the column
-                result[column] = self._anonymize_column(
-                    df[column], rule, column_name=column
-                )
-                self._stats["columns_anonymized"] += 1
-
-            except Exception as e:
-                error_msg = f"Error anonymizing column '{column}': {str(e)}"
-                self._stats["errors"].append(error_msg)
+            jobs.append((column, rule))
+
+        # Columns are independent and the hot paths (hashlib, numpy) release
+        # the GIL, so wide, long frames are anonymized on a thread pool
+        workers = min(self.max_workers, len(jobs))
+        executor = None
+        if workers > 1 and len(df) >= self.PARALLEL_MIN_ROWS:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            outputs = [
+                executor.submit(self._anonymize_column, df[column], rule, column).result
+                for column, rule in jobs
+            ]
+        else:
+            outputs = [
+                functools.partial(self._anonymize_column, df[column], rule, column)
+                for column, rule in jobs
+            ]
 
-                # Re-raise if we want to fail fast
-                if not self.global_config.handle_nulls:
-                    raise AnonymizationError(error_msg) from e
+        try:
+            for (column, _), output in zip(jobs, outputs):
+                try:
+                    # Anonymize the column
+                    result[column] = output()
+                    stats["columns_anonymized"] += 1
+
+                except Exception as e:
+                    error_msg = f"Error anonymizing column '{column}': {str(e)}"
+                    stats["errors"].append(error_msg)
+
+                    # Re-raise if we want to fail fast
+                    if not self.global_config.handle_nulls:
+                        raise AnonymizationError(error_msg) from e
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self._stats = stats
 
         return result
 
@@ -336,7 +723,31 @@ class Anonymizer:
             return column_mapping.get(column)
         else:
             # Assume column name matches PII type
-            return column if self.config.has_rule(column) else None
+            return column if column in self._rules else None
+
+    def _compile_rule(self, rule: RuleConfig) -> Callable[[pd.Series], pd.Series]:
+        """
+        Bind a rule's strategy and parameters into a column transform.
+
+        Args:
+            rule: Anonymization rule to compile
+
+        Returns:
+            Callable taking a Series and returning the anonymized Series
+
+        Raises:
+            AnonymizationError: If the rule's strategy is unknown
+        """
+        strategy_func = self._strategy_map.get(rule.strategy)
+        if strategy_func is None:
+            raise AnonymizationError(f"Unknown strategy: {rule.strategy}")
+
+        series_func = self._series_strategy_map.get(rule.strategy)
+        if series_func is not None:
+            return functools.partial(series_func, parameters=rule.parameters)
+
+        value_func = functools.partial(strategy_func, parameters=rule.parameters)
+        return lambda series: series.map(value_func, na_action="ignore")
 
     def _anonymize_column(
         self, series: pd.Series, rule: RuleConfig, column_name: str
@@ -353,16 +764,17 @@ class Anonymizer:
             Anonymized series
         """
         strategy = rule.strategy
-        parameters = rule.parameters
 
-        # Get strategy function
-        strategy_func = self._strategy_map.get(strategy)
-        if strategy_func is None:
-            raise AnonymizationError(f"Unknown strategy: {strategy}")
+        # Configured rules were compiled at construction; any other rule (or
+        # one with an unknown strategy) is compiled (or rejected) here
+        transform = None
+        if self._rules.get(rule.pii_type) is rule:
+            transform = self._compiled_rules.get(rule.pii_type)
+        if transform is None:
+            transform = self._compile_rule(rule)
 
-        # Apply strategy to each value
         try:
-            result = series.apply(lambda x: strategy_func(x, parameters))
+            result = transform(series)
 
             # Try to preserve data types where possible
             if self.global_config.preserve_data_types:
@@ -433,7 +845,7 @@ class Anonymizer:
 
     def get_statistics(self) -> Dict[str, Any]:
         """
-        Get anonymization statistics from last run.
+        Get anonymization statistics from the last completed run.
 
         Returns:
             Dictionary with statistics
@@ -465,15 +877,53 @@ def anonymize(
         >>> df = pd.DataFrame({'email': ['john@example.com'], 'age': [34]})
         >>> anonymized = anonymize(df, 'config/anonymization_rules.yaml')
     """
+    # Load config if needed; files are re-read only when they change
+    if not isinstance(config, ConfigLoader):
+        path = Path(config).resolve()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None  # let load_config report the missing file
+        config = _load_config_cached(path, mtime_ns)
+
+    # Reuse the anonymizer (and its compiled rules) for this config
+    return _get_anonymizer(config).anonymize(df, column_mapping)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: Path, mtime_ns: Optional[int]) -> ConfigLoader:
+    """
+    Load a configuration file, memoized by resolved path and modification time.
+
+    Args:
+        path: Resolved path to the configuration file
+        mtime_ns: File modification time, part of the cache key
+
+    Returns:
+        Loaded ConfigLoader instance
+    """
     from src.config_loader import load_config
 
-    # Load config if needed
-    if not isinstance(config, ConfigLoader):
-        config = load_config(Path(config))
+    return load_config(path)
+
 
-    # Create anonymizer and apply
-    anonymizer = Anonymizer(config)
-    return anonymizer.anonymize(df, column_mapping)
+@functools.lru_cache(maxsize=32)
+def _get_anonymizer(config: ConfigLoader) -> Anonymizer:
+    """
+    Get the shared Anonymizer for a configuration object.
+
+    Keyed by identity; a ConfigLoader that is re-loaded in place keeps the
+    rules compiled when it was first seen. Anonymizer.anonymize keeps its
+    statistics per call, so the shared instance may be used from several
+    threads at once.
+
+    Args:
+        config: Loaded ConfigLoader instance
+
+    Returns:
+        Anonymizer for the configuration
+    """
+    return Anonymizer(config)
 
 
 # Example usage
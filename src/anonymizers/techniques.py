@@ -8,16 +8,119 @@ Implements various anonymization strategies:
 - Pseudonymization (consistent fake data)
 """
 
+import calendar
+import functools
 import hashlib
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+import numpy as np
 from faker import Faker
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def _extract_digits(text: str) -> str:
+    """
+    Strip every non-digit character from a string
+
+    Already-normalized input (e.g. "123456789") and the common dash-separated
+    fixed formats (SSNs, card numbers) are handled without running the regex.
+
+    Args:
+        text: String to filter
+
+    Returns:
+        The digits of text, in order
+    """
+    if text.isdecimal():
+        return text
+    dashless = text.replace("-", "")
+    if dashless.isdecimal():
+        return dashless
+    return _NON_DIGIT_RE.sub("", text)
+
+
+def _bucket_lower_bounds(values: np.ndarray, range_size: int) -> np.ndarray:
+    """
+    Compute the lower bound of each value's bucket in one vectorized pass
+
+    Floors in float64, so fractional values bucket like the scalar
+    generalizers and non-finite values can't wrap around as an int64 cast.
+
+    Args:
+        values: Numeric array
+        range_size: Size of each bucket
+
+    Returns:
+        float64 array of bucket lower bounds, NaN for NaN/inf values
+    """
+    with np.errstate(invalid="ignore"):
+        return np.floor_divide(values.astype(np.float64), range_size) * range_size
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _range_label(lower: int, upper: int) -> str:
+    """
+    Build (once) the interned "lower-upper" label for an integer bucket
+
+    Args:
+        lower: Bucket lower bound
+        upper: Bucket upper bound (inclusive)
+
+    Returns:
+        Interned label string
+    """
+    return sys.intern(f"{lower}-{upper}")
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _income_label(lower: int, upper: int) -> str:
+    """
+    Build (once) the interned "$lower-$upper" label for an income bracket
+
+    Args:
+        lower: Bracket lower bound
+        upper: Bracket upper bound (inclusive)
+
+    Returns:
+        Interned label string
+    """
+    return sys.intern(f"${lower:,}-${upper:,}")
+
+
+def _label_by_unique(keys: np.ndarray, make_label: Callable[[Any], str]) -> np.ndarray:
+    """
+    Map every key to a label, formatting each distinct key only once
+
+    Args:
+        keys: Array of keys (e.g. bucket lower bounds)
+        make_label: Builds the label for one key
+
+    Returns:
+        Object array of labels, same order as keys
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    labels = np.array([make_label(key) for key in unique_keys.tolist()], dtype=object)
+    return labels[inverse.reshape(-1)]
+
 
 class HashingTechnique:
     """Implements hashing-based anonymization using SHA256"""
 
+    # Types whose equal values always have the same str(); only these are
+    # safe keys for the encoded-bytes cache (1 == 1.0 == True otherwise)
+    _ENCODE_CACHE_TYPES = (str, int, type(None))
+    _ENCODE_CACHE_SIZE = 1024
+
+    # Smallest batch worth splitting across threads in hash_many
+    _PARALLEL_MIN_VALUES = 8
+
     def __init__(self, salt: Optional[str] = None):
         """
         Initialize hashing technique
@@ -27,6 +130,62 @@ class HashingTechnique:
         """
         self.salt = salt
 
+        self._encoded_cache: dict = {}
+
+        # Hash state with the instance salt already absorbed; copied per call
+        self._base_salt = salt
+        self._base = self._new_salted_hash(salt)
+
+    def _new_salted_hash(self, salt: Optional[str]):
+        """
+        Create a hash object that has already absorbed the salt prefix
+
+        Args:
+            salt: Salt to absorb (nothing is absorbed if empty)
+
+        Returns:
+            SHA256 hash object ready for the value bytes
+        """
+        hash_obj = hashlib.sha256()
+        if salt:
+            hash_obj.update(f"{salt}:".encode("utf-8"))
+        return hash_obj
+
+    def _to_bytes(self, value: Any) -> bytes:
+        """
+        UTF-8 encode str(value), remembering recent strings, ints and None
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Encoded bytes
+        """
+        if type(value) not in self._ENCODE_CACHE_TYPES:
+            return str(value).encode("utf-8")
+
+        cache = self._encoded_cache
+        encoded = cache.get(value)
+        if encoded is None:
+            if len(cache) >= self._ENCODE_CACHE_SIZE:
+                cache.clear()
+            encoded = cache[value] = str(value).encode("utf-8")
+        return encoded
+
+    def _salted_prototype(self, salt: Optional[str]):
+        """
+        Get the salted hash state for salt, reusing the instance one if possible
+
+        Args:
+            salt: Effective salt for this call
+
+        Returns:
+            SHA256 hash object to copy; must not be updated directly
+        """
+        if salt == self._base_salt:
+            return self._base
+        return self._new_salted_hash(salt)
+
     def hash_value(self, value: Any, salt: Optional[str] = None) -> str:
         """
         Hash a value using SHA256
@@ -38,19 +197,87 @@ class HashingTechnique:
         Returns:
             Hexadecimal hash string
         """
+        return self._hash_object(value, salt).hexdigest()
+
+    def _hash_object(self, value: Any, salt: Optional[str] = None):
+        """
+        Feed "salt:value" into a SHA256 hash object
+
+        Args:
+            value: Value to hash
+            salt: Optional salt (overrides instance salt)
+
+        Returns:
+            Hash object holding the digest of the salted value
+        """
         # Use provided salt or instance salt
         effective_salt = salt if salt is not None else self.salt
 
-        # Convert value to string
-        str_value = str(value)
+        # Hash "salt:value" by extending the pre-salted state
+        hash_obj = self._salted_prototype(effective_salt).copy()
+        hash_obj.update(self._to_bytes(value))
+        return hash_obj
+
+    def hash_many(
+        self,
+        values: Iterable[Any],
+        salt: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Hash many values using SHA256
 
-        # Add salt if provided
-        if effective_salt:
-            str_value = f"{effective_salt}:{str_value}"
+        The salt is absorbed once into a prototype hash object which is then
+        copied per value, so each value only pays for hashing itself.
 
-        # Compute SHA256 hash
-        hash_obj = hashlib.sha256(str_value.encode("utf-8"))
-        return hash_obj.hexdigest()
+        hashlib releases the GIL while hashing large buffers, so long values
+        (documents, blobs) can be spread over threads with max_workers.
+
+        Args:
+            values: Values to hash
+            salt: Optional salt (overrides instance salt)
+            max_workers: Threads to split the batch across (default: one)
+
+        Returns:
+            List of hexadecimal hash strings, in input order
+        """
+        effective_salt = salt if salt is not None else self.salt
+        prototype = self._salted_prototype(effective_salt)
+
+        values = list(values)
+        if (
+            max_workers is None
+            or max_workers <= 1
+            or len(values) < self._PARALLEL_MIN_VALUES
+        ):
+            return self._hash_chunk(prototype, values)
+
+        chunk_size = -(-len(values) // max_workers)
+        chunks = [
+            values[start : start + chunk_size]
+            for start in range(0, len(values), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda c: self._hash_chunk(prototype, c), chunks)
+            return [digest for chunk in results for digest in chunk]
+
+    def _hash_chunk(self, prototype, values: List[Any]) -> List[str]:
+        """
+        Hash a list of values by extending copies of a salted prototype
+
+        Args:
+            prototype: Salted hash state (not modified)
+            values: Values to hash
+
+        Returns:
+            List of hexadecimal hash strings, in input order
+        """
+        hashes = []
+        for value in values:
+            hash_obj = prototype.copy()
+            hash_obj.update(self._to_bytes(value))
+            hashes.append(hash_obj.hexdigest())
+        return hashes
 
     def hash_with_prefix(
         self, value: Any, prefix: str = "HASH_", salt: Optional[str] = None
@@ -68,13 +295,22 @@ class HashingTechnique:
         Returns:
             Prefixed hash string
         """
-        hash_value = self.hash_value(value, salt)
-        return f"{prefix}{hash_value[:16]}"  # Use first 16 chars for readability
+        # First 8 digest bytes == first 16 hex chars, kept for readability
+        short_hash = self._hash_object(value, salt).digest()[:8].hex()
+        return f"{prefix}{short_hash}"
 
 
 class RedactionTechnique:
     """Implements redaction-based anonymization"""
 
+    # All partial-redaction shapes in one pattern, longest digit runs first
+    _PII_RE = re.compile(
+        r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+        r"|(?P<credit_card>\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b)"
+        r"|(?P<ssn>\b\d{3}-\d{2}-\d{4}\b)"
+        r"|(?P<phone>(?<!\d)\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?!\d))"
+    )
+
     @staticmethod
     def redact_full(value: Any, replacement: str = "[REDACTED]") -> str:
         """
@@ -131,7 +367,7 @@ class RedactionTechnique:
         """
 
         # Extract only digits
-        digits = re.sub(r"\D", "", phone)
+        digits = _extract_digits(phone)
 
         if len(digits) <= keep_last:
             return phone
@@ -159,7 +395,7 @@ class RedactionTechnique:
             Partially redacted SSN
         """
         # Extract only digits
-        digits = re.sub(r"\D", "", ssn)
+        digits = _extract_digits(ssn)
 
         if len(digits) != 9:
             return ssn
@@ -180,13 +416,39 @@ class RedactionTechnique:
             Partially redacted card numner
         """
         # Extract only digits
-        digits = re.sub(r"\D", "", card)
+        digits = _extract_digits(card)
 
         if len(digits) != 16:
             return card
 
         return f"****-****-****-{digits[-4:]}"
 
+    @staticmethod
+    def redact_all(text: str) -> str:
+        """
+        Partially redact every email, phone, SSN and credit card in free text
+
+        The text is scanned once with a combined pattern and each match is
+        masked by the matching redact_partial_* method.
+
+        Example: "Call 555-123-4567" -> "Call ***-***-4567"
+
+        Args:
+            text: Text to redact
+
+        Returns:
+            Text with all recognized PII partially redacted
+        """
+        maskers = {
+            "email": RedactionTechnique.redact_partial_email,
+            "credit_card": RedactionTechnique.redact_partial_credit_card,
+            "ssn": RedactionTechnique.redact_partial_ssn,
+            "phone": RedactionTechnique.redact_partial_phone,
+        }
+        return RedactionTechnique._PII_RE.sub(
+            lambda match: maskers[match.lastgroup](match.group()), text
+        )
+
     @staticmethod
     def redact_partial(
         value: str, keep_start: int = 1, keep_end: int = 0, mask_char: str = "*"
@@ -219,6 +481,72 @@ class RedactionTechnique:
 class GeneralizationTechnique:
     """Implements generalization-based anonymization."""
 
+    # ISO date (optionally followed by a time), unpadded YYYY-M-D, or
+    # MM/DD/YYYY / DD/MM/YYYY
+    _DATE_RE = re.compile(
+        r"^\s*([0-9]{4})-([0-9]{2})-([0-9]{2})(?:\s.*)?$"
+        r"|^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})$"
+        r"|^([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})$"
+    )
+
+    # Quarter for each month number (index 0 unused)
+    _QUARTER_OF_MONTH = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+    @staticmethod
+    def _parse_date(date: Union[str, datetime]) -> Optional[datetime]:
+        """
+        Parse a date string, passing datetime-like objects through.
+
+        Plain ISO dates go straight to datetime.fromisoformat. Other common
+        formats are matched and validated with one precompiled regex, so
+        invalid input is rejected without raising. Remaining ISO 8601 forms
+        (e.g. "20240315", "2024-03-15T10:00") also go to fromisoformat.
+
+        Args:
+            date: Date string or datetime
+
+        Returns:
+            Parsed date, or None if the string can't be parsed
+        """
+        if not isinstance(date, str):
+            return date
+
+        # Plain YYYY-MM-DD is by far the most common input; fromisoformat
+        # parses it in C
+        if len(date) == 10 and date[4] == "-" and date[7] == "-":
+            try:
+                return datetime.fromisoformat(date)
+            except ValueError:
+                pass
+
+        match = GeneralizationTechnique._DATE_RE.match(date)
+        if match:
+            groups = match.groups()
+            if groups[0] is not None:
+                year, month, day = map(int, groups[0:3])
+            elif groups[3] is not None:
+                year, month, day = map(int, groups[3:6])
+            else:
+                month, day, year = map(int, groups[6:9])
+                if month > 12:  # DD/MM/YYYY
+                    month, day = day, month
+            if (
+                year >= 1
+                and 1 <= month <= 12
+                and 1 <= day <= calendar.monthrange(year, month)[1]
+            ):
+                return datetime(year, month, day)
+            return None
+
+        # Only strings that start like an ISO year can still be ISO dates
+        parts = date.split(None, 1)
+        if not parts or not (parts[0][:4].isdigit() and parts[0].isascii()):
+            return None
+        try:
+            return datetime.fromisoformat(parts[0])
+        except ValueError:
+            return None
+
     @staticmethod
     def generalize_age(age: int, range_size: int = 10) -> str:
         """
@@ -235,8 +563,39 @@ class GeneralizationTechnique:
         """
         lower_bound = (age // range_size) * range_size
         upper_bound = lower_bound + range_size - 1
+        if type(lower_bound) is int:
+            return _range_label(lower_bound, upper_bound)
         return f"{lower_bound}-{upper_bound}"
 
+    @staticmethod
+    def generalize_age_many(ages: Any, range_size: int = 10) -> np.ndarray:
+        """
+        Generalize a whole column of ages into ranges.
+
+        Bucketing runs as a single array operation and each distinct range
+        label is formatted only once. Labels match generalize_age: integer
+        input gives "30-39", float input "30.0-39.0".
+
+        Args:
+            ages: Array-like of ages
+            range_size: Size of age range (default: 10 years)
+
+        Returns:
+            Object array of age range strings (None for NaN/inf ages), same
+            order as the input
+        """
+        ages = np.asarray(ages)
+        integral = ages.dtype.kind in "iub"
+
+        def make_label(lower: float) -> Optional[str]:
+            if lower != lower:  # NaN
+                return None
+            if integral:
+                return _range_label(int(lower), int(lower) + range_size - 1)
+            return f"{lower}-{lower + range_size - 1}"
+
+        return _label_by_unique(_bucket_lower_bounds(ages, range_size), make_label)
+
     @staticmethod
     def generalize_zipcode(zipcode: str, precision: int = 3) -> str:
         """
@@ -254,13 +613,35 @@ class GeneralizationTechnique:
         str_zip = str(zipcode)
 
         # Remove any non-digits
-        digits_only = re.sub(r"\D", "", str_zip)
+        digits_only = _extract_digits(str_zip)
 
         if len(digits_only) < precision:
             return str_zip
 
         return digits_only[:precision] + "*" * (len(digits_only) - precision)
 
+    @staticmethod
+    def generalize_zipcode_many(zipcodes: Any, precision: int = 3) -> np.ndarray:
+        """
+        Generalize a whole column of zipcodes.
+
+        Each distinct zipcode is generalized once and the result is gathered
+        back to every row.
+
+        Args:
+            zipcodes: Array-like of zipcodes
+            precision: Number of digits to keep (default: 3)
+
+        Returns:
+            Object array of generalized zipcodes, same order as the input
+        """
+        return _label_by_unique(
+            np.asarray(zipcodes).astype(str),
+            lambda zipcode: GeneralizationTechnique.generalize_zipcode(
+                zipcode, precision
+            ),
+        )
+
     @staticmethod
     def generalize_date_to_quarter(date: Union[str, datetime]) -> str:
         """
@@ -274,27 +655,12 @@ class GeneralizationTechnique:
         Returns:
             Quarter string (YYYY-QN)
         """
-        if isinstance(date, str):
-            # Try to parse date string
-            try:
-                date_obj = datetime.fromisoformat(
-                    date.split()[0]
-                )  # Handle datetime strings
-            except ValueError:
-                # Try common formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        date_obj = datetime.strptime(date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return date  # Return original if can't parse
-        else:
-            date_obj = date
+        date_obj = GeneralizationTechnique._parse_date(date)
+        if date_obj is None:
+            return date  # Return original if can't parse
 
         # Determine quarter
-        quarter = (date_obj.month - 1) // 3 + 1
+        quarter = GeneralizationTechnique._QUARTER_OF_MONTH[date_obj.month]
         return f"{date_obj.year}-Q{quarter}"
 
     @staticmethod
@@ -310,20 +676,9 @@ class GeneralizationTechnique:
         Returns:
             Year-month string (YYYY-MM)
         """
-        if isinstance(date, str):
-            try:
-                date_obj = datetime.fromisoformat(date.split()[0])
-            except ValueError:
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        date_obj = datetime.strptime(date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return date
-        else:
-            date_obj = date
+        date_obj = GeneralizationTechnique._parse_date(date)
+        if date_obj is None:
+            return date  # Return original if can't parse
 
         return f"{date_obj.year}-{date_obj.month:02d}"
 
@@ -340,20 +695,9 @@ class GeneralizationTechnique:
         Returns:
             Year string
         """
-        if isinstance(date, str):
-            try:
-                date_obj = datetime.fromisoformat(date.split()[0])
-            except ValueError:
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        date_obj = datetime.strptime(date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return date
-        else:
-            date_obj = date
+        date_obj = GeneralizationTechnique._parse_date(date)
+        if date_obj is None:
+            return date  # Return original if can't parse
 
         return str(date_obj.year)
 
@@ -390,20 +734,9 @@ class GeneralizationTechnique:
         ]
 
         # Parse date to get birth year
-        if isinstance(date, str):
-            try:
-                date_obj = datetime.fromisoformat(date.split()[0])
-            except ValueError:
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        date_obj = datetime.strptime(date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return date  # Return original if can't parse
-        else:
-            date_obj = date
+        date_obj = GeneralizationTechnique._parse_date(date)
+        if date_obj is None:
+            return date  # Return original if can't parse
 
         birth_year = date_obj.year
 
@@ -464,8 +797,37 @@ class GeneralizationTechnique:
         """
         lower_bound = (int(income) // bracket_size) * bracket_size
         upper_bound = lower_bound + bracket_size - 1
+        if type(lower_bound) is int:
+            return _income_label(lower_bound, upper_bound)
         return f"${lower_bound:,}-${upper_bound:,}"
 
+    @staticmethod
+    def generalize_income_many(incomes: Any, bracket_size: int = 10000) -> np.ndarray:
+        """
+        Generalize a whole column of incomes into brackets.
+
+        Incomes are truncated toward zero first, as int() does in
+        generalize_income.
+
+        Args:
+            incomes: Array-like of incomes
+            bracket_size: Size of income bracket
+
+        Returns:
+            Object array of income bracket strings (None for NaN/inf incomes),
+            same order as the input
+        """
+        return _label_by_unique(
+            _bucket_lower_bounds(
+                np.trunc(np.asarray(incomes, dtype=np.float64)), bracket_size
+            ),
+            lambda lower: (
+                None
+                if lower != lower  # NaN
+                else _income_label(int(lower), int(lower) + bracket_size - 1)
+            ),
+        )
+
     @staticmethod
     def generalize_numeric_range(value: float, range_size: float) -> str:
         """
@@ -486,25 +848,35 @@ class GeneralizationTechnique:
 class PseudonymizationTechnique:
     """Implements pseudonymization with consistent fake data."""
 
-    def __init__(self):
-        """Initialize pseudonymization technique."""
-        self._faker_cache = {}  # Cache Faker instances by seed
-
-    def _get_faker(self, seed: int) -> Faker:
+    # How each fake_type is drawn from a (seeded) Faker
+    _GENERATORS = {
+        "name": lambda faker: faker.name(),
+        "email": lambda faker: faker.email(),
+        "phone": lambda faker: faker.phone_number(),
+        "address": lambda faker: faker.address().replace("\n", ", "),
+        "company": lambda faker: faker.company(),
+        "city": lambda faker: faker.city(),
+    }
+
+    def __init__(self, cache_size: int = 100_000):
         """
-        Get or create a Faker instance with specific seed.
+        Initialize pseudonymization technique.
 
         Args:
-            seed: Seed for Faker
-
-        Returns:
-            Faker instance
+            cache_size: Maximum number of pseudonyms to remember (LRU);
+                0 disables the cache
         """
-        if seed not in self._faker_cache:
-            faker = Faker()
-            Faker.seed(seed)
-            self._faker_cache[seed] = faker
-        return self._faker_cache[seed]
+        self.cache_size = cache_size
+        self._pseudonym_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._pseudonym_cache_lock = threading.Lock()
+
+        # One Faker reseeded per value; uniform (unweighted) draws are faster
+        self._faker = Faker(use_weighting=False)
+        self._faker_lock = threading.Lock()
+
+        # Touch each provider once so lazy provider loading happens up front
+        for generate in self._GENERATORS.values():
+            generate(self._faker)
 
     def _get_seed(self, value: Any) -> int:
         """
@@ -516,9 +888,45 @@ class PseudonymizationTechnique:
         Returns:
             Integer seed
         """
-        # Use hash of value as seed for consistency
-        hash_value = hashlib.md5(str(value).encode("utf-8")).hexdigest()
-        return int(hash_value[:8], 16)  # Use first 8 hex chars as seed
+        # Seeds only need to be stable, not cryptographic; a 64-bit blake2b
+        # digest is fast and gives the same seed on every install
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def _memoized(self, fake_type: str, value: Any) -> str:
+        """
+        Return the cached pseudonym for value, generating it on a miss.
+
+        Args:
+            fake_type: Kind of fake data (a key of _GENERATORS)
+            value: Original value
+
+        Returns:
+            Fake data
+        """
+        # Keyed on the same text the seed is derived from, so equal values of
+        # different types (1, 1.0, True) never share an entry and unhashable
+        # values still work
+        text = str(value)
+        key = (fake_type, text)
+        cache = self._pseudonym_cache
+
+        with self._pseudonym_cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        seed = self._get_seed(text)
+        with self._faker_lock:
+            self._faker.seed_instance(seed)
+            result = self._GENERATORS[fake_type](self._faker)
+
+        if self.cache_size > 0:
+            with self._pseudonym_cache_lock:
+                cache[key] = result
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return result
 
     def pseudonymize_name(self, name: str) -> str:
         """
@@ -532,10 +940,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake name
         """
-        seed = self._get_seed(name)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.name()
+        return self._memoized("name", name)
 
     def pseudonymize_email(self, email: str) -> str:
         """
@@ -547,10 +952,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake email
         """
-        seed = self._get_seed(email)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.email()
+        return self._memoized("email", email)
 
     def pseudonymize_phone(self, phone: str) -> str:
         """
@@ -562,10 +964,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake phone number
         """
-        seed = self._get_seed(phone)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.phone_number()
+        return self._memoized("phone", phone)
 
     def pseudonymize_address(self, address: str) -> str:
         """
@@ -577,10 +976,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake address
         """
-        seed = self._get_seed(address)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.address().replace("\n", ", ")
+        return self._memoized("address", address)
 
     def pseudonymize_company(self, company: str) -> str:
         """
@@ -592,10 +988,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake company name
         """
-        seed = self._get_seed(company)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.company()
+        return self._memoized("company", company)
 
     def pseudonymize_city(self, city: str) -> str:
         """
@@ -607,10 +1000,7 @@ class PseudonymizationTechnique:
         Returns:
             Fake city name
         """
-        seed = self._get_seed(city)
-        faker = Faker()
-        Faker.seed(seed)
-        return faker.city()
+        return self._memoized("city", city)
 
     def pseudonymize_generic(self, value: Any, fake_type: str = "name") -> str:
         """
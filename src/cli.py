@@ -502,6 +502,8 @@ Examples:
                 json.dump(output_data, f, indent=2)
             print(f"\nResults saved to {args.output}")
 
+        return 0
+
     def cmd_anonymize(self, args):
         """Execute anonymize command"""
         print(f"Anonymizing {args.file}...")
@@ -685,11 +687,10 @@ Examples:
             else None
         )
 
-        if utility_report.distribution_metrics:
-            avg_dist = sum(
-                (1 - m.ks_statistic)
-                for m in utility_report.distribution_metrics.values()
-            ) / len(utility_report.distribution_metrics)
+        if not utility_report.distribution_metrics.empty:
+            avg_dist = float(
+                (1 - utility_report.distribution_metrics["ks_statistic"]).mean()
+            )
             utility_dict["distribution_similarity"] = avg_dist
         else:
             utility_dict["distribution_similarity"] = None
@@ -738,20 +739,25 @@ Examples:
 
         print(f"   Report saved to {output_path}")
 
-    def run(self):
-        """Main entry point"""
+    def run(self, argv: Optional[List[str]] = None):
+        """Main entry point
+
+        Args:
+            argv: Command-line arguments; defaults to sys.argv[1:]
+        """
+        import codecs
         import io
 
-        if sys.stdout.encoding != "utf-8":
+        if codecs.lookup(sys.stdout.encoding).name != "utf-8":
             sys.stdout = io.TextIOWrapper(
                 sys.stdout.buffer, encoding="utf-8", errors="replace"
             )
-        if sys.stderr.encoding != "utf-8":
+        if codecs.lookup(sys.stderr.encoding).name != "utf-8":
             sys.stderr = io.TextIOWrapper(
                 sys.stderr.buffer, encoding="utf-8", errors="replace"
             )
 
-        args = self.parser.parse_args()
+        args = self.parser.parse_args(argv)
 
         if not args.command:
             self.parser.print_help()
@@ -5,11 +5,20 @@ This module handles loading, validating, and parsing YAML configuration files fo
 """
 
 from typing import Dict, Any, List, Optional, Set
+import copy
+import functools
+import json
 from pathlib import Path
 import yaml  # pyright: ignore[reportMissingModuleSource]
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class AnonymizationStrategy(Enum):
     """Enumeration of supported anonymization strategies."""
@@ -178,7 +187,8 @@ class RuleConfig:
 
         elif self.strategy == AnonymizationStrategy.HASH:
             algorithm = self.parameters.get("algorithm")
-            allowed_algorithms = ["sha256", "sha512", "md5"]  # md5 not recommended
+            # md5 not recommended
+            allowed_algorithms = ["sha256", "sha512", "blake2b", "md5"]
             if algorithm not in allowed_algorithms:
                 raise ConfigurationError(
                     f"Invalid hash algorithm for '{self.pii_type}': "
@@ -213,7 +223,9 @@ class ConfigLoader:
         Args:
             config_path: Path to the configuration file. If None, uses default.
         """
-        self.config_path = config_path or self._get_default_config_path()
+        self.config_path: Optional[Path] = (
+            config_path or self._get_default_config_path()
+        )
         self._raw_config: Optional[Dict[str, Any]] = None
         self._rules: Optional[Dict[str, RuleConfig]] = None
         self._global_config: Optional[GlobalConfig] = None
@@ -234,14 +246,44 @@ class ConfigLoader:
             ConfigurationError: If loading or validation fails
         """
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                self._raw_config = yaml.safe_load(f)
+            with open(self.config_path, "rb") as f:
+                content = f.read()
         except FileNotFoundError:
             raise ConfigurationError(
                 f"Configuration file not found: {self.config_path}"
             )
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML syntax in {self.config_path}: {e}")
+
+        return self._load_content(content)
+
+    def _load_content(self, content: bytes) -> "ConfigLoader":
+        """
+        Parse and validate the raw contents of the configuration file.
+
+        Args:
+            content: YAML document read from config_path, or a JSON document
+                if config_path has a .json suffix
+
+        Returns:
+            self for method chaining
+
+        Raises:
+            ConfigurationError: If parsing or validation fails
+        """
+        if self.config_path is not None and Path(self.config_path).suffix == ".json":
+            # JSON is a subset of YAML, but the stdlib parser is much faster
+            try:
+                self._raw_config = json.loads(content)
+            except ValueError as e:
+                raise ConfigurationError(
+                    f"Invalid JSON syntax in {self.config_path}: {e}"
+                )
+        else:
+            try:
+                self._raw_config = yaml.load(content, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                raise ConfigurationError(
+                    f"Invalid YAML syntax in {self.config_path}: {e}"
+                )
 
         self._validate_schema()
         self._parse_rules()
@@ -249,6 +291,33 @@ class ConfigLoader:
 
         return self
 
+    @classmethod
+    def from_dict(cls, config_dict: Dict[str, Any]) -> "ConfigLoader":
+        """
+        Build and validate a configuration from an in-memory dictionary.
+
+        Runs the same validation as load() without touching the filesystem
+        or the YAML parser.
+
+        Args:
+            config_dict: Configuration with the same structure as the YAML file
+
+        Returns:
+            Loaded ConfigLoader instance
+
+        Raises:
+            ConfigurationError: If validation fails
+        """
+        loader = cls()
+        loader.config_path = None
+        loader._raw_config = copy.deepcopy(config_dict)
+
+        loader._validate_schema()
+        loader._parse_rules()
+        loader._parse_global_config()
+
+        return loader
+
     def _validate_schema(self) -> None:
         """
         Validate the overall configuration schema.
@@ -431,7 +500,8 @@ def load_config(config_path: Optional[Path] = None) -> ConfigLoader:
         config_path: Path to configuration file
 
     Returns:
-        Loaded ConfigLoader instance
+        Loaded ConfigLoader instance. Loads are memoized on the file's path
+        and contents, so the instance may be shared: treat it as read-only.
 
     Example:
         >>> config = load_config()
@@ -439,7 +509,29 @@ def load_config(config_path: Optional[Path] = None) -> ConfigLoader:
         >>> print(email_rule.strategy)
     """
     loader = ConfigLoader(config_path)
-    return loader.load()
+    try:
+        with open(loader.config_path, "rb") as f:
+            content = f.read()
+    except OSError:
+        # Let load() report the missing or unreadable file
+        return loader.load()
+
+    return _load_config_content(Path(loader.config_path).resolve(), content)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_config_content(config_path: Path, content: bytes) -> ConfigLoader:
+    """
+    Parse and validate a configuration file's contents, memoized.
+
+    Args:
+        config_path: Resolved path the contents were read from
+        content: Raw file contents
+
+    Returns:
+        Loaded ConfigLoader instance
+    """
+    return ConfigLoader(config_path)._load_content(content)
 
 
 # Example usage
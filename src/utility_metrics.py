@@ -9,19 +9,59 @@ Measures how well anonymization preserves data utility through:
 Provides quantifiable metrics for the privacy/utility tradeoff.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+import functools
+import hashlib
+import os
+import pickle
+import re
+import threading
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, field
-import warnings
+from dataclasses import dataclass, field, replace
 
 # Import scipy for statistical analysis
 try:
     from scipy import stats  # type: ignore
-    from scipy.spatial.distance import correlation as correlation_distance  # type: ignore
 except ImportError:
     stats = None
-    correlation_distance = None
+
+
+# Columns of the per-column distribution metrics table in UtilityReport
+DISTRIBUTION_METRIC_FIELDS = [
+    "ks_statistic",
+    "ks_pvalue",
+    "mean_absolute_diff",
+    "median_absolute_diff",
+    "std_ratio",
+]
+
+# KS statistic upper bounds and their interpretations (checked in order)
+_KS_INTERPRETATIONS = [
+    (0.1, "Excellent preservation (>90%)"),
+    (0.2, "Good preservation (80-90%)"),
+    (0.3, "Moderate preservation (70-80%)"),
+]
+_KS_POOR_INTERPRETATION = "Poor preservation (<70%)"
+
+# Distribution and correlation metrics are bounded statistics, so numeric
+# columns are analyzed in float32 (halving memory traffic on wide tables) once
+# centered on the original mean. Tables whose centered values exceed this
+# bound (large IDs, wide timestamp ranges) stay float64. Reductions always
+# accumulate in float64.
+_FLOAT32_EXACT_BOUND = 2**24
+
+# Suggested location for compare_utility's on-disk report cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "utility_metrics"
+
+# Part of every on-disk cache key; bump whenever UtilityReport's layout or the
+# metric computations change, so reports pickled by older versions are ignored
+_REPORT_CACHE_VERSION = 2
+
+# Generalized numeric range such as "45-49", "90000-94999" or "-5--1"
+_RANGE_RE = re.compile(r"^\s*([-+]?\d*\.?\d+)\s*-\s*([-+]?\d*\.?\d+)\s*$")
 
 
 class UtilityMetricsError(Exception):
@@ -30,6 +70,20 @@ class UtilityMetricsError(Exception):
     pass
 
 
+def _interpret_ks_statistics(ks_statistics: np.ndarray) -> np.ndarray:
+    """Map an array of KS statistics to distribution interpretations."""
+    return np.select(
+        [ks_statistics < bound for bound, _ in _KS_INTERPRETATIONS],
+        [label for _, label in _KS_INTERPRETATIONS],
+        default=_KS_POOR_INTERPRETATION,
+    )
+
+
+def _empty_distribution_frame() -> pd.DataFrame:
+    """Create an empty distribution metrics table."""
+    return pd.DataFrame(columns=DISTRIBUTION_METRIC_FIELDS + ["interpretation"])
+
+
 @dataclass
 class DistributionMetrics:
     """Metrics for distribution preservation."""
@@ -43,14 +97,9 @@ class DistributionMetrics:
 
     def __post_init__(self):
         """Add interpretation based on metrics."""
-        if self.ks_statistic < 0.1:
-            self.interpretation = "Excellent preservation (>90%)"
-        elif self.ks_statistic < 0.2:
-            self.interpretation = "Good preservation (80-90%)"
-        elif self.ks_statistic < 0.3:
-            self.interpretation = "Moderate preservation (70-80%)"
-        else:
-            self.interpretation = "Poor preservation (<70%)"
+        self.interpretation = str(
+            _interpret_ks_statistics(np.array([self.ks_statistic]))[0]
+        )
 
 
 @dataclass
@@ -108,7 +157,10 @@ class UtilityReport:
     """Comprehensive utility metrics report."""
 
     overall_utility_score: float
-    distribution_metrics: Dict[str, DistributionMetrics] = field(default_factory=dict)
+    # One row per analyzed column, indexed by column name
+    distribution_metrics: pd.DataFrame = field(
+        default_factory=_empty_distribution_frame
+    )
     correlation_metrics: Optional[CorrelationMetrics] = None
     information_loss_metrics: Dict[str, InformationLossMetrics] = field(
         default_factory=dict
@@ -118,36 +170,70 @@ class UtilityReport:
 
     def get_summary(self) -> str:
         """Get human-readable summary."""
-        lines = [
-            "=" * 60,
-            "UTILITY METRICS REPORT",
-            "=" * 60,
-            f"\nOverall Utility Score: {self.overall_utility_score:.1f}%",
-            f"\nInterpretation: {self._get_overall_interpretation()}",
+        rule = "=" * 60
+        interpretation = self._get_overall_interpretation()
+        sections = [
+            f"{rule}\nUTILITY METRICS REPORT\n{rule}"
+            f"\n\nOverall Utility Score: {self.overall_utility_score:.1f}%"
+            f"\n\nInterpretation: {interpretation}"
         ]
 
-        if self.distribution_metrics:
-            lines.append("\n--- Distribution Preservation ---")
-            for col, metrics in self.distribution_metrics.items():
-                lines.append(f"  {col}: {metrics.interpretation}")
+        if not self.distribution_metrics.empty:
+            sections.append("\n--- Distribution Preservation ---")
+            sections.append(
+                "\n".join(
+                    f"  {col}: {col_interpretation}"
+                    for col, col_interpretation in self.distribution_metrics[
+                        "interpretation"
+                    ].items()
+                )
+            )
 
         if self.correlation_metrics:
-            lines.append("\n--- Correlation Preservation ---")
-            lines.append(f"  {self.correlation_metrics.interpretation}")
+            sections.append(
+                "\n--- Correlation Preservation ---"
+                f"\n  {self.correlation_metrics.interpretation}"
+            )
 
         if self.information_loss_metrics:
-            lines.append("\n--- Information Loss ---")
-            for col, metrics in self.information_loss_metrics.items():
-                lines.append(f"  {col}: {metrics.interpretation}")
+            sections.append("\n--- Information Loss ---")
+            sections.append(
+                "\n".join(
+                    f"  {col}: {metrics.interpretation}"
+                    for col, metrics in self.information_loss_metrics.items()
+                )
+            )
 
         if self.recommendations:
-            lines.append("\n--- Recommendations ---")
-            for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"  {i}. {rec}")
+            sections.append("\n--- Recommendations ---")
+            sections.append(
+                "\n".join(
+                    f"  {i}. {rec}" for i, rec in enumerate(self.recommendations, 1)
+                )
+            )
+
+        sections.append(f"\n{rule}")
+
+        return "\n".join(sections)
+
+    def get_distribution_metrics(self, column: str) -> DistributionMetrics:
+        """
+        Get distribution metrics for a single column.
+
+        Args:
+            column: Column name
 
-        lines.append("\n" + "=" * 60)
+        Returns:
+            DistributionMetrics object
 
-        return "\n".join(lines)
+        Raises:
+            KeyError: If column was not analyzed
+        """
+        row = self.distribution_metrics.loc[column]
+        return DistributionMetrics(
+            **{name: float(row[name]) for name in DISTRIBUTION_METRIC_FIELDS},
+            interpretation="",  # Set in __post_init__
+        )
 
     def _get_overall_interpretation(self) -> str:
         """Get interpretation of overall score."""
@@ -173,6 +259,10 @@ class UtilityMetrics:
     doesn't perform anonymization.
     """
 
+    # Minimum rows before report metrics are computed on a thread pool; below
+    # this the pool costs more than it saves
+    PARALLEL_MIN_ROWS = 10_000
+
     def __init__(self, original_df: pd.DataFrame, anonymized_df: pd.DataFrame):
         """
         Initialize utility metrics calculator.
@@ -192,6 +282,56 @@ class UtilityMetrics:
 
         # Identify numeric columns (for distribution/correlation analysis)
         self.numeric_cols = self._get_numeric_columns()
+        self._numeric_positions = {col: i for i, col in enumerate(self.numeric_cols)}
+
+        # Columns whose values can be counted on both sides; list- or
+        # dict-valued columns (e.g. location history) are left out of
+        # information loss analysis
+        self._countable_cols = frozenset(
+            col
+            for col in self.original.columns
+            if self._is_hashable_column(self.original[col])
+            and self._is_hashable_column(self.anonymized[col])
+        )
+
+        # The original data never changes, so stack its numeric columns into
+        # one matrix, sort it column-wise once and cache each column's sorted
+        # (NaN-free) values with its mean/median/std. Both sides are centered
+        # on the original column means before any downcast (every metric is
+        # invariant to that shared shift).
+        original_values = self.original[self.numeric_cols].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        valid_counts = (~np.isnan(original_values)).sum(axis=0)
+        self._column_offsets = np.nansum(original_values, axis=0) / np.maximum(
+            valid_counts, 1
+        )
+        self._column_offsets[~np.isfinite(self._column_offsets)] = 0.0
+        centered = original_values - self._column_offsets
+        max_magnitude = np.fmax.reduce(np.abs(centered), axis=None, initial=0.0)
+        analysis_dtype = (
+            np.float32 if max_magnitude <= _FLOAT32_EXACT_BOUND else np.float64
+        )
+        self._original_matrix = centered.astype(analysis_dtype, copy=False)
+        # NaNs sort last, so each column's valid values are a prefix
+        self._original_sorted = np.sort(
+            np.asfortranarray(self._original_matrix), axis=0
+        )
+        original_counts = (~np.isnan(self._original_sorted)).sum(axis=0)
+        self._original_numeric: Dict[str, np.ndarray] = {}
+        self._original_stats: Dict[str, Tuple[float, float, float]] = {}
+        for i, col in enumerate(self.numeric_cols):
+            values = self._original_sorted[: original_counts[i], i]
+            self._original_numeric[col] = values
+            self._original_stats[col] = self._sorted_summary_stats(values)
+
+        # Anonymized numeric matrix, converted on first use (see
+        # _get_anonymized_matrix); report columns are analyzed from threads
+        self._anonymized_matrix: Optional[np.ndarray] = None
+        self._anonymized_matrix_lock = threading.Lock()
+
+        # Reports already generated on this instance, by analyzed column tuple
+        self._report_cache: Dict[Tuple[str, ...], UtilityReport] = {}
 
     def _validate_dataframes(
         self, original: pd.DataFrame, anonymized: pd.DataFrame
@@ -216,6 +356,39 @@ class UtilityMetrics:
 
         return numeric_cols
 
+    @staticmethod
+    def _sorted_numeric_values(series: pd.Series) -> np.ndarray:
+        """Convert series to a sorted float64 array, dropping non-numeric values."""
+        numeric = pd.to_numeric(series, errors="coerce").dropna()
+        return np.sort(numeric.to_numpy(dtype=np.float64))
+
+    @staticmethod
+    def _sorted_summary_stats(values: np.ndarray) -> Tuple[float, float, float]:
+        """
+        Calculate mean, median and sample standard deviation of sorted values.
+
+        Args:
+            values: Sorted, NaN-free array
+
+        Returns:
+            Tuple of (mean, median, std); NaN where undefined
+        """
+        n = values.size
+        if n == 0:
+            return np.nan, np.nan, np.nan
+
+        # Two-pass mean and variance (float64 accumulation), matching the
+        # batched anonymized summaries; the median is read directly off the
+        # sorted values
+        mean = float(values.mean(dtype=np.float64))
+        median = (float(values[(n - 1) // 2]) + float(values[n // 2])) / 2
+
+        std = np.nan
+        if n > 1:
+            std = float(np.sqrt(values.var(ddof=1, dtype=np.float64)))
+
+        return mean, median, std
+
     @staticmethod
     def _parse_generalized_range(value: Any) -> Optional[float]:
         """
@@ -224,6 +397,7 @@ class UtilityMetrics:
         Handles formats like:
         - "45-49" -> 47.0 (midpoint)
         - "90000-94999" -> 92499.5 (midpoint)
+        - "-5--1" -> -3.0 (signed bounds)
         - "45" -> 45.0 (single value)
         - Already numeric -> return as-is
 
@@ -244,17 +418,12 @@ class UtilityMetrics:
         # Convert to string for parsing
         str_value = str(value).strip()
 
-        # Try to parse as range (e.g., "45-49", "90000-94999")
-        if "-" in str_value:
-            try:
-                parts = str_value.split("-")
-                if len(parts) == 2:
-                    start = float(parts[0].strip())
-                    end = float(parts[1].strip())
-                    # Return midpoint
-                    return (start + end) / 2.0
-            except (ValueError, AttributeError):
-                pass
+        # Try to parse as range (e.g., "45-49", "90000-94999", "-5--1")
+        match = _RANGE_RE.match(str_value)
+        if match:
+            start, end = match.groups()
+            # Return midpoint
+            return (float(start) + float(end)) / 2.0
 
         # Try to parse as single number
         try:
@@ -263,7 +432,7 @@ class UtilityMetrics:
             return None
 
     def _convert_to_numeric_with_ranges(
-        self, series: pd.Series, column_name: str
+        self, series: pd.Series, column_name: str, dtype: Optional[Any] = None
     ) -> pd.Series:
         """
         Convert series to numeric, handling generalized ranges.
@@ -271,6 +440,7 @@ class UtilityMetrics:
         Args:
             series: Series to convert
             column_name: Column name (for error messages)
+            dtype: Optional float dtype to cast the result to
 
         Returns:
             Series with numeric values (NaN for unparseable values)
@@ -287,8 +457,37 @@ class UtilityMetrics:
             # Use parsed values where original conversion failed
             numeric_series = numeric_series.fillna(parsed_values)
 
+        if dtype is not None:
+            numeric_series = numeric_series.astype(dtype)
+
         return numeric_series
 
+    def _get_anonymized_matrix(self) -> np.ndarray:
+        """
+        Get the anonymized numeric columns as a matrix aligned with numeric_cols.
+
+        Values are converted with generalized-range parsing and centered on
+        the original column means; the matrix is built once and shared by
+        distribution and correlation analysis.
+
+        Returns:
+            Array of shape (rows, len(numeric_cols)), NaN where unparseable
+        """
+        with self._anonymized_matrix_lock:
+            if self._anonymized_matrix is None:
+                matrix = np.empty_like(self._original_matrix)
+                for i, col in enumerate(self.numeric_cols):
+                    # Centered on the original mean, like _original_matrix
+                    matrix[:, i] = (
+                        self._convert_to_numeric_with_ranges(
+                            self.anonymized[col], col
+                        ).to_numpy(dtype=np.float64, na_value=np.nan)
+                        - self._column_offsets[i]
+                    )
+                self._anonymized_matrix = matrix
+
+            return self._anonymized_matrix
+
     def calculate_distribution_preservation(self, column: str) -> DistributionMetrics:
         """
         Calculate distribution preservation metrics for a column.
@@ -299,6 +498,34 @@ class UtilityMetrics:
         Returns:
             DistributionMetrics object
 
+        Raises:
+            UtilityMetricsError: If column not numeric
+        """
+        ks_stat, ks_pval, mean_diff, median_diff, std_ratio = self._distribution_values(
+            column
+        )
+
+        return DistributionMetrics(
+            ks_statistic=ks_stat,
+            ks_pvalue=ks_pval,
+            mean_absolute_diff=mean_diff,
+            median_absolute_diff=median_diff,
+            std_ratio=std_ratio,
+            interpretation="",  # Set in __post_init__
+        )
+
+    def _distribution_values(
+        self, column: str
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Calculate raw distribution preservation values for a column.
+
+        Args:
+            column: Column name to analyze
+
+        Returns:
+            Tuple ordered as DISTRIBUTION_METRIC_FIELDS
+
         Raises:
             UtilityMetricsError: If column not numeric
         """
@@ -311,45 +538,168 @@ class UtilityMetrics:
         if column not in self.original.columns:
             raise UtilityMetricsError(f"Column '{column}' not found")
 
-        # Get data, removing NaNs
-        original_data = self.original[column].dropna()
-        anonymized_data = self.anonymized[column].dropna()
+        # Original numeric columns are converted once in __init__
+        if column in self._original_numeric:
+            original_numeric = self._original_numeric[column]
+            original_mean, original_median, original_std = self._original_stats[column]
+        else:
+            original_numeric = self._sorted_numeric_values(self.original[column])
+            original_mean, original_median, original_std = self._sorted_summary_stats(
+                original_numeric
+            )
+
+        # Nothing to compare against, so the anonymized side (possibly the
+        # whole anonymized matrix) is never converted
+        if len(original_numeric) == 0:
+            raise UtilityMetricsError(f"Column '{column}' has no valid numeric values")
 
         # Check if numeric, handling generalized ranges
         try:
-            original_numeric = pd.to_numeric(original_data, errors="coerce").dropna()
-            # Use range parsing for anonymized data (may contain generalized ranges)
-            anonymized_numeric = self._convert_to_numeric_with_ranges(
-                anonymized_data, column
-            ).dropna()
+            if column in self._numeric_positions:
+                # Numeric columns are read from the shared anonymized matrix
+                anonymized_values = self._get_anonymized_matrix()[
+                    :, self._numeric_positions[column]
+                ]
+                anonymized_numeric = np.sort(
+                    anonymized_values[~np.isnan(anonymized_values)]
+                )
+            else:
+                # Use range parsing for anonymized data (may contain generalized
+                # ranges)
+                anonymized_numeric = np.sort(
+                    self._convert_to_numeric_with_ranges(
+                        self.anonymized[column].dropna(), column, dtype=np.float64
+                    )
+                    .dropna()
+                    .to_numpy()
+                )
         except Exception as e:
             raise UtilityMetricsError(
                 f"Column '{column}' cannot be converted to numeric: {e}"
             )
 
-        if len(original_numeric) == 0 or len(anonymized_numeric) == 0:
+        if len(anonymized_numeric) == 0:
             raise UtilityMetricsError(f"Column '{column}' has no valid numeric values")
 
+        # Pass-through column: both sides are sorted, so equal arrays mean
+        # identical distributions
+        if np.array_equal(original_numeric, anonymized_numeric):
+            return 0.0, 1.0, 0.0, 0.0, 1.0
+
         # Kolmogorov-Smirnov test
         ks_stat, ks_pval = stats.ks_2samp(original_numeric, anonymized_numeric)
 
+        # Both sides are summarized the same way so identical data compares equal
+        anonymized_mean, anonymized_median, anonymized_std = self._sorted_summary_stats(
+            anonymized_numeric
+        )
+
         # Mean and median differences
-        mean_diff = abs(original_numeric.mean() - anonymized_numeric.mean())
-        median_diff = abs(original_numeric.median() - anonymized_numeric.median())
+        mean_diff = abs(original_mean - anonymized_mean)
+        median_diff = abs(original_median - anonymized_median)
 
         # Standard deviation ratio
-        original_std = original_numeric.std()
-        anonymized_std = anonymized_numeric.std()
         std_ratio = anonymized_std / original_std if original_std > 0 else 1.0
 
-        return DistributionMetrics(
-            ks_statistic=ks_stat,
-            ks_pvalue=ks_pval,
-            mean_absolute_diff=mean_diff,
-            median_absolute_diff=median_diff,
-            std_ratio=std_ratio,
-            interpretation="",  # Set in __post_init__
+        return ks_stat, ks_pval, mean_diff, median_diff, std_ratio
+
+    def _can_calculate_distribution(self, column: str) -> bool:
+        """Check whether a column has numeric original values to compare."""
+        return (
+            stats is not None
+            and column in self._original_numeric
+            and self._original_numeric[column].size > 0
+        )
+
+    def _compute_all_distribution_metrics(self, columns: List[str]) -> pd.DataFrame:
+        """
+        Calculate distribution preservation metrics for numeric columns in a batch.
+
+        The anonymized columns are sorted as one matrix and summarized with
+        vectorized reductions. Columns with no missing values on either side
+        share one vectorized KS test; the rest are tested per column. Columns
+        without valid numeric values on both sides are left out of the table.
+
+        Args:
+            columns: Column names that pass _can_calculate_distribution
+
+        Returns:
+            DataFrame indexed by column name with DISTRIBUTION_METRIC_FIELDS
+            and an interpretation column
+        """
+        if not columns:
+            return _empty_distribution_frame()
+
+        positions = [self._numeric_positions[col] for col in columns]
+        column_idx = np.arange(len(columns))
+
+        # NaNs sort last, so the first counts[i] rows of column i are its
+        # valid values in ascending order
+        anonymized_sorted = np.sort(
+            np.asfortranarray(self._get_anonymized_matrix()[:, positions]), axis=0
+        )
+        counts = (~np.isnan(anonymized_sorted)).sum(axis=0)
+        analyzable = counts > 0
+
+        # Anonymized summaries for all columns at once (float64 accumulation)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.nansum(anonymized_sorted, axis=0, dtype=np.float64) / counts
+            squared_deviations = np.square(anonymized_sorted - means)
+            stds = np.sqrt(np.nansum(squared_deviations, axis=0) / (counts - 1))
+        last_row = len(anonymized_sorted) - 1
+        medians = (
+            anonymized_sorted[np.maximum(counts - 1, 0) // 2, column_idx].astype(
+                np.float64
+            )
+            + anonymized_sorted[np.minimum(counts // 2, last_row), column_idx]
+        ) / 2
+
+        original_stats = np.array(
+            [self._original_stats[col] for col in columns], dtype=np.float64
+        ).reshape(len(columns), 3)
+        original_means, original_medians, original_stds = original_stats.T
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std_ratios = np.where(original_stds > 0, stds / original_stds, 1.0)
+
+        values = np.empty((len(columns), len(DISTRIBUTION_METRIC_FIELDS)))
+        values[:, 2] = np.abs(original_means - means)
+        values[:, 3] = np.abs(original_medians - medians)
+        values[:, 4] = std_ratios
+
+        n_rows = len(anonymized_sorted)
+        complete = []
+        for i in np.flatnonzero(analyzable):
+            original_values = self._original_numeric[columns[i]]
+            anonymized_values = anonymized_sorted[: counts[i], i]
+
+            # Pass-through column: identical sorted values, identical distribution
+            if np.array_equal(original_values, anonymized_values):
+                values[i] = (0.0, 1.0, 0.0, 0.0, 1.0)
+            elif original_values.size == n_rows and counts[i] == n_rows:
+                complete.append(i)
+            else:
+                values[i, :2] = stats.ks_2samp(original_values, anonymized_values)
+
+        # Equal-length samples: one KS call over all complete columns
+        if complete:
+            ks_result = stats.ks_2samp(
+                self._original_sorted[:, [positions[i] for i in complete]],
+                anonymized_sorted[:, complete],
+                axis=0,
+            )
+            values[complete, 0] = ks_result.statistic
+            values[complete, 1] = ks_result.pvalue
+
+        frame = pd.DataFrame(
+            values[analyzable],
+            index=pd.Index(columns)[analyzable],
+            columns=DISTRIBUTION_METRIC_FIELDS,
+        )
+        frame["interpretation"] = _interpret_ks_statistics(
+            frame["ks_statistic"].to_numpy()
         )
+        return frame
 
     def calculate_correlation_preservation(self) -> CorrelationMetrics:
         """
@@ -361,63 +711,73 @@ class UtilityMetrics:
         Raises:
             UtilityMetricsError: If not enough numeric columns
         """
-        if correlation_distance is None:
-            raise UtilityMetricsError(
-                "scipy library required for correlation analysis. "
-                "Install with: pip install scipy"
-            )
-
-        if len(self.numeric_cols) < 2:
+        if not self._can_calculate_correlation():
             raise UtilityMetricsError(
                 "Need at least 2 numeric columns for correlation analysis"
             )
 
-        # Calculate correlation matrices
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+        corr_metrics = self._correlation_metrics()
+        if corr_metrics is None:
+            raise UtilityMetricsError("No valid correlations to compare")
 
-            original_corr = self.original[self.numeric_cols].corr()
+        return corr_metrics
 
-            # Handle anonymized data that might be strings or generalized ranges
-            anonymized_numeric = self.anonymized[self.numeric_cols].copy()
-            for col in self.numeric_cols:
-                anonymized_numeric[col] = self._convert_to_numeric_with_ranges(
-                    anonymized_numeric[col], col
-                )
+    def _can_calculate_correlation(self) -> bool:
+        """Check whether there are enough numeric columns for correlation analysis."""
+        return len(self.numeric_cols) >= 2
+
+    def _correlation_metrics(self) -> Optional[CorrelationMetrics]:
+        """
+        Calculate correlation preservation metrics.
 
-            anonymized_corr = anonymized_numeric.corr()
+        Returns:
+            CorrelationMetrics object, or None if no column pair has a
+            valid correlation on both sides
+        """
+        # Dense numeric matrices (anonymized side parsed for generalized ranges)
+        original_matrix = self._original_matrix
+        anonymized_matrix = self._get_anonymized_matrix()
 
-        # Flatten correlation matrices (excluding diagonal)
-        mask = np.triu(np.ones_like(original_corr, dtype=bool), k=1)
-        original_flat = original_corr.values[mask]
-        anonymized_flat = anonymized_corr.values[mask]
+        original_corr = self._correlation_matrix(original_matrix)
+        anonymized_corr = self._correlation_matrix(anonymized_matrix)
+
+        # Flatten correlation matrices (upper triangle, excluding diagonal)
+        upper = np.triu_indices(len(self.numeric_cols), k=1)
+        original_flat = original_corr[upper].astype(np.float64)
+        anonymized_flat = anonymized_corr[upper].astype(np.float64)
 
         # Remove NaN values
-        valid_mask = ~(np.isnan(original_flat) | np.isnan(anonymized_flat))
+        valid_mask = ~np.isnan(original_flat)
+        valid_mask &= ~np.isnan(anonymized_flat)
         original_flat = original_flat[valid_mask]
         anonymized_flat = anonymized_flat[valid_mask]
 
         if len(original_flat) == 0:
-            raise UtilityMetricsError("No valid correlations to compare")
+            return None
+
+        # Correlation distance: 1 - pearson(original_flat, anonymized_flat).
+        # Identical and zero-variance vectors are treated as perfectly
+        # preserved
+        if np.array_equal(original_flat, anonymized_flat):
+            return CorrelationMetrics(
+                correlation_distance=0.0,
+                correlation_similarity=1.0,
+                mean_absolute_difference=0.0,
+                max_absolute_difference=0.0,
+                interpretation="",  # Set in __post_init__
+            )
+
+        original_centered = original_flat - original_flat.mean()
+        anonymized_centered = anonymized_flat - anonymized_flat.mean()
+        original_norm = np.linalg.norm(original_centered)
+        anonymized_norm = np.linalg.norm(anonymized_centered)
 
-        # Calculate correlation distance with warning suppression
-        # Handle edge case: identical vectors return NaN, should be 0 distance
-        # Suppress RuntimeWarnings from scipy when encountering edge cases (zero variance, etc.)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", RuntimeWarning)
-            try:
-                corr_dist = correlation_distance(original_flat, anonymized_flat)
-                if np.isnan(corr_dist):
-                    # Vectors are identical (perfect correlation preservation)
-                    corr_dist = 0.0
-            except (ValueError, ZeroDivisionError):
-                # Handle edge case where std dev is zero or other numerical issues
-                # Check if vectors are identical
-                if np.allclose(original_flat, anonymized_flat):
-                    corr_dist = 0.0
-                else:
-                    # Can't compute correlation distance, assume maximum distance
-                    corr_dist = 1.0
+        if original_norm < 1e-12 or anonymized_norm < 1e-12:
+            corr_dist = 0.0
+        else:
+            corr_dist = 1.0 - float(original_centered @ anonymized_centered) / (
+                original_norm * anonymized_norm
+            )
 
         corr_similarity = 1 - corr_dist
 
@@ -434,6 +794,33 @@ class UtilityMetrics:
             interpretation="",  # Set in __post_init__
         )
 
+    @staticmethod
+    def _correlation_matrix(matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate the column correlation matrix of a numeric matrix.
+
+        Complete matrices go straight to np.corrcoef. With missing values,
+        correlations are pairwise-complete (as DataFrame.corr), so a sparse
+        column such as a hashed numeric ID doesn't mask out every row.
+
+        Args:
+            matrix: Array of shape (rows, columns), NaN where missing
+
+        Returns:
+            Correlation matrix (NaN where a pair has no valid correlation)
+        """
+        n_cols = matrix.shape[1]
+        if len(matrix) < 2:
+            # Correlations need at least two rows
+            return np.full((n_cols, n_cols), np.nan)
+
+        if not np.isnan(matrix).any():
+            # Zero-variance columns yield NaN
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.corrcoef(matrix, rowvar=False, dtype=matrix.dtype)
+
+        return pd.DataFrame(matrix).corr().to_numpy()
+
     def calculate_information_loss(self, column: str) -> InformationLossMetrics:
         """
         Calculate information loss metrics for a column.
@@ -447,23 +834,85 @@ class UtilityMetrics:
         if column not in self.original.columns:
             raise UtilityMetricsError(f"Column '{column}' not found")
 
-        original_data = self.original[column].dropna()
-        anonymized_data = self.anonymized[column].dropna()
+        if not self._can_calculate_information_loss(column):
+            raise UtilityMetricsError(
+                f"Column '{column}' contains unhashable values (e.g. lists)"
+            )
+
+        original_counts, anonymized_counts = self._information_loss_counts(column)
+        entropy_original, entropy_anonymized = self._entropies_from_counts(
+            [original_counts, anonymized_counts]
+        )
+        return self._information_loss_metrics(
+            len(original_counts),
+            float(entropy_original),
+            len(anonymized_counts),
+            float(entropy_anonymized),
+        )
+
+    def _can_calculate_information_loss(self, column: str) -> bool:
+        """Check whether a column's values can be counted on both sides."""
+        return column in self._countable_cols
+
+    @staticmethod
+    def _is_hashable_column(series: pd.Series) -> bool:
+        """
+        Check whether every value in a series is hashable, so it can be factorized.
+
+        Only object columns can hold unhashable values such as lists or dicts;
+        other dtypes are accepted without scanning.
+
+        Args:
+            series: Data series
+
+        Returns:
+            True if all values are hashable
+        """
+        if series.dtype != object:
+            return True
+
+        return all(map(pd.api.types.is_hashable, series.to_numpy()))
+
+    def _information_loss_counts(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count distinct values of a column before and after anonymization.
+
+        Args:
+            column: Column name to analyze
+
+        Returns:
+            Tuple of (original counts, anonymized counts), NaNs excluded
+        """
+        return (
+            self._value_counts(self.original[column].dropna()),
+            self._value_counts(self.anonymized[column].dropna()),
+        )
+
+    @staticmethod
+    def _information_loss_metrics(
+        unique_original: int,
+        entropy_original: float,
+        unique_anonymized: int,
+        entropy_anonymized: float,
+    ) -> InformationLossMetrics:
+        """
+        Build information loss metrics from unique counts and entropies.
 
-        # Count unique values
-        unique_original = original_data.nunique()
-        unique_anonymized = anonymized_data.nunique()
+        Args:
+            unique_original: Number of distinct original values
+            entropy_original: Entropy of the original column
+            unique_anonymized: Number of distinct anonymized values
+            entropy_anonymized: Entropy of the anonymized column
 
+        Returns:
+            InformationLossMetrics object
+        """
         unique_retained_pct = (
             (unique_anonymized / unique_original * 100)
             if unique_original > 0
             else 100.0
         )
 
-        # Calculate entropy
-        entropy_original = self._calculate_entropy(original_data)
-        entropy_anonymized = self._calculate_entropy(anonymized_data)
-
         entropy_retained_pct = (
             (entropy_anonymized / entropy_original * 100)
             if entropy_original > 0
@@ -480,6 +929,28 @@ class UtilityMetrics:
             interpretation="",  # Set in __post_init__
         )
 
+    @staticmethod
+    def _value_counts(series: pd.Series) -> np.ndarray:
+        """
+        Count occurrences of each distinct value in a NaN-free series.
+
+        Plain numeric and boolean columns are counted with np.unique, which
+        skips building a pandas result; other dtypes (strings, mixed objects,
+        extension types) go through pd.factorize.
+
+        Args:
+            series: Data series without missing values
+
+        Returns:
+            Array of counts, one per distinct value
+        """
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            _, counts = np.unique(series.to_numpy(), return_counts=True)
+            return counts
+
+        codes, _ = pd.factorize(series)
+        return np.bincount(codes)
+
     @staticmethod
     def _calculate_entropy(series: pd.Series) -> float:
         """
@@ -491,20 +962,61 @@ class UtilityMetrics:
         Returns:
             Entropy value
         """
-        value_counts = series.value_counts()
-        probabilities = value_counts / len(series)
+        return UtilityMetrics._entropy_from_counts(
+            UtilityMetrics._value_counts(series.dropna())
+        )
+
+    @staticmethod
+    def _entropy_from_counts(counts: np.ndarray) -> float:
+        """
+        Calculate Shannon entropy from value counts.
+
+        Args:
+            counts: Occurrence count of each distinct value (all positive)
+
+        Returns:
+            Entropy value
+        """
+        return float(UtilityMetrics._entropies_from_counts([counts])[0])
+
+    @staticmethod
+    def _entropies_from_counts(counts_list: List[np.ndarray]) -> np.ndarray:
+        """
+        Calculate Shannon entropy for several sets of value counts at once.
+
+        The ragged count arrays are concatenated and reduced segment-wise
+        with np.add.reduceat, so any number of columns costs one vectorized
+        pass instead of one reduction per column.
+
+        Args:
+            counts_list: Count arrays (all positive), one per column
 
-        # Shannon entropy: -sum(p * log2(p))
-        # Use where() to avoid log of zero without offset that causes precision issues
-        entropy = -np.sum(
-            np.where(probabilities > 0, probabilities * np.log2(probabilities), 0)
+        Returns:
+            Array of entropies aligned with counts_list (0.0 for empty counts)
+        """
+        entropies = np.zeros(len(counts_list))
+        lengths = np.array([counts.size for counts in counts_list], dtype=np.intp)
+        present = lengths > 0
+        if not present.any():
+            return entropies
+
+        # Empty segments are dropped, so each remaining start is followed by
+        # the next non-empty segment's start (or the end of the array)
+        starts = (np.cumsum(lengths) - lengths)[present]
+        counts = np.concatenate(counts_list)
+        totals = np.add.reduceat(counts, starts)
+        probabilities = counts / np.repeat(totals, lengths[present])
+
+        # Shannon entropy: -sum(p * log2(p)); counts only cover values that
+        # occur, so every probability is positive
+        entropies[present] = -np.add.reduceat(
+            probabilities * np.log2(probabilities), starts
         )
 
         # Handle floating point precision: return exactly 0 for near-zero values
-        if abs(entropy) < 1e-9:
-            return 0.0
+        entropies[np.abs(entropies) < 1e-9] = 0.0
 
-        return entropy
+        return entropies
 
     def generate_report(
         self, columns_to_analyze: Optional[List[str]] = None
@@ -512,6 +1024,10 @@ class UtilityMetrics:
         """
         Generate comprehensive utility report.
 
+        Both DataFrames are treated as read-only, so reports are memoized per
+        column selection. Each call returns its own copy of the memoized
+        report, so callers may edit it freely.
+
         Args:
             columns_to_analyze: List of columns to analyze.
                                If None, analyzes all columns.
@@ -522,40 +1038,93 @@ class UtilityMetrics:
         if columns_to_analyze is None:
             columns_to_analyze = list(self.original.columns)
 
+        cache_key = tuple(columns_to_analyze)
+        if cache_key not in self._report_cache:
+            self._report_cache[cache_key] = self._build_report(columns_to_analyze)
+        report = self._report_cache[cache_key]
+        return replace(
+            report,
+            distribution_metrics=report.distribution_metrics.copy(),
+            information_loss_metrics=dict(report.information_loss_metrics),
+            column_level_scores=dict(report.column_level_scores),
+            recommendations=list(report.recommendations),
+        )
+
+    def _build_report(self, columns_to_analyze: List[str]) -> UtilityReport:
+        """
+        Compute a utility report for the given columns.
+
+        Args:
+            columns_to_analyze: List of columns to analyze
+
+        Returns:
+            UtilityReport object
+        """
         report = UtilityReport(overall_utility_score=0.0)
 
-        # Calculate distribution preservation for numeric columns
-        for col in columns_to_analyze:
-            if col in self.numeric_cols:
-                try:
-                    metrics = self.calculate_distribution_preservation(col)
-                    report.distribution_metrics[col] = metrics
-                except Exception:
-                    pass  # Skip columns that can't be analyzed
-
-        # Calculate correlation preservation
-        if len(self.numeric_cols) >= 2:
-            try:
-                corr_metrics = self.calculate_correlation_preservation()
-                report.correlation_metrics = corr_metrics
-            except Exception:
-                pass  # Skip if correlation can't be calculated
-
-        # Calculate information loss for all columns
-        for col in columns_to_analyze:
-            try:
-                info_metrics = self.calculate_information_loss(col)
-                report.information_loss_metrics[col] = info_metrics
-            except Exception:
-                pass  # Skip columns that can't be analyzed
+        # Per-column metrics are dominated by numpy/pandas/scipy work that
+        # releases the GIL, so on long frames columns are analyzed
+        # concurrently. Columns (and the correlation matrix) that metrics
+        # don't apply to are filtered up front rather than skipped on failure.
+        count_columns = [
+            col
+            for col in columns_to_analyze
+            if self._can_calculate_information_loss(col)
+        ]
+        count_tasks = [
+            functools.partial(self._information_loss_counts, col)
+            for col in count_columns
+        ]
+        corr_task = (
+            self._correlation_metrics if self._can_calculate_correlation() else None
+        )
+
+        workers = min(os.cpu_count() or 1, len(count_tasks) + (corr_task is not None))
+        executor = None
+        if workers > 1 and len(self.original) >= self.PARALLEL_MIN_ROWS:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            count_tasks = [executor.submit(task).result for task in count_tasks]
+            if corr_task is not None:
+                corr_task = executor.submit(corr_task).result
+
+        try:
+            # Calculate distribution preservation for numeric columns
+            report.distribution_metrics = self._compute_all_distribution_metrics(
+                [
+                    col
+                    for col in columns_to_analyze
+                    if self._can_calculate_distribution(col)
+                ]
+            )
+
+            # Calculate correlation preservation
+            if corr_task is not None:
+                report.correlation_metrics = corr_task()
+
+            # Calculate information loss (in column order), with the entropy
+            # of every column on both sides computed in one pass
+            column_counts = {
+                col: task() for col, task in zip(count_columns, count_tasks)
+            }
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        entropies = self._entropies_from_counts(
+            [counts for pair in column_counts.values() for counts in pair]
+        ).reshape(-1, 2)
+        for i, (col, counts) in enumerate(column_counts.items()):
+            entropy_original, entropy_anonymized = entropies[i].tolist()
+            report.information_loss_metrics[col] = self._information_loss_metrics(
+                len(counts[0]), entropy_original, len(counts[1]), entropy_anonymized
+            )
 
         # Calculate overall utility score
         scores = []
 
         # Distribution scores (based on KS statistic)
-        for metrics in report.distribution_metrics.values():
-            score = max(0, 100 * (1 - metrics.ks_statistic))
-            scores.append(score)
+        ks_statistics = report.distribution_metrics["ks_statistic"].to_numpy()
+        scores.extend(np.maximum(0, 100 * (1 - ks_statistics)).tolist())
 
         # Correlation score
         if report.correlation_metrics:
@@ -587,11 +1156,8 @@ class UtilityMetrics:
             )
 
         # Check distribution preservation
-        poor_dist_cols = [
-            col
-            for col, metrics in report.distribution_metrics.items()
-            if metrics.ks_statistic > 0.3
-        ]
+        dist_metrics = report.distribution_metrics
+        poor_dist_cols = list(dist_metrics.index[dist_metrics["ks_statistic"] > 0.3])
         if poor_dist_cols:
             recommendations.append(
                 f"Improve distribution preservation for: {', '.join(poor_dist_cols)}"
@@ -623,11 +1189,57 @@ class UtilityMetrics:
         return recommendations
 
 
+def _dataframe_digest(df: pd.DataFrame) -> bytes:
+    """Hash a DataFrame's columns, dtypes, index and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.digest()
+
+
+def _report_cache_key(
+    original_df: pd.DataFrame,
+    anonymized_df: pd.DataFrame,
+    columns: Optional[List[str]],
+) -> str:
+    """Build the on-disk cache key for a compare_utility call."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{_REPORT_CACHE_VERSION}".encode("utf-8"))
+    digest.update(_dataframe_digest(original_df))
+    digest.update(_dataframe_digest(anonymized_df))
+    digest.update(repr(None if columns is None else list(columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_cached_report(cache_path: Path) -> Optional[UtilityReport]:
+    """
+    Load a cached report, treating unreadable or stale entries as a miss.
+
+    Args:
+        cache_path: Path of the pickled report
+
+    Returns:
+        The cached UtilityReport, or None if absent or unusable
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            report = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, AttributeError, EOFError, ImportError, TypeError):
+        # Written by an incompatible version (or truncated); recompute
+        return None
+
+    return report if isinstance(report, UtilityReport) else None
+
+
 # Convenience function
 def compare_utility(
     original_df: pd.DataFrame,
     anonymized_df: pd.DataFrame,
     columns: Optional[List[str]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
 ) -> UtilityReport:
     """
     Convenience function to compare utility of anonymized data.
@@ -636,6 +1248,10 @@ def compare_utility(
         original_df: Original DataFrame
         anonymized_df: Anonymized DataFrame
         columns: Optional list of columns to analyze
+        cache_dir: Optional directory (e.g. DEFAULT_CACHE_DIR) for persisting
+                   reports. Reports are keyed by a hash of both DataFrames and
+                   the column selection, so re-runs on the same inputs load
+                   the stored report instead of recomputing it.
 
     Returns:
         UtilityReport object
@@ -644,8 +1260,26 @@ def compare_utility(
         >>> report = compare_utility(original, anonymized)
         >>> print(report.get_summary())
     """
+    cache_path = None
+    if cache_dir is not None:
+        cache_key = _report_cache_key(original_df, anonymized_df, columns)
+        cache_path = Path(cache_dir) / f"{cache_key}.pkl"
+        cached = _load_cached_report(cache_path)
+        if cached is not None:
+            return cached
+
     metrics = UtilityMetrics(original_df, anonymized_df)
-    return metrics.generate_report(columns)
+    report = metrics.generate_report(columns)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial report
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(report, f)
+        os.replace(tmp_path, cache_path)
+
+    return report
 
 
 # Example usage
@@ -0,0 +1,55 @@
+"""
+Shared pytest configuration.
+
+Keeps tests that share an expensive session-scoped fixture on the same
+pytest-xdist worker, so the fixture is built once rather than once per
+worker. Run in parallel with: pytest -n auto --dist loadgroup
+
+Tests must not touch the global np.random state, so their results do not
+depend on what else ran on the same worker.
+
+Benchmarks (pytest-benchmark) run once, untimed, unless asked for with
+--benchmark-only or --benchmark-enable.
+"""
+
+import numpy as np
+import pytest
+
+# Session-scoped fixtures whose users should share a worker, by group name
+XDIST_GROUPS = {
+    "customers_df": "customers",
+    # Also covers anonymized_* and column_mapping, which are built from it
+    "scan_results": "integration-pipeline",
+}
+
+
+def pytest_configure(config):
+    """Disable benchmark timing by default; it is opted into per run."""
+    if config.pluginmanager.hasplugin("benchmark") and not (
+        config.getoption("benchmark_only") or config.getoption("benchmark_enable")
+    ):
+        config.option.benchmark_disable = True
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag tests using a grouped fixture with the matching xdist_group."""
+    for item in items:
+        for fixture_name, group in XDIST_GROUPS.items():
+            if fixture_name in item.fixturenames:
+                item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+@pytest.fixture(autouse=True)
+def _untouched_global_rng():
+    """Fail tests that draw from or reseed the global np.random state.
+
+    Tests must use a local np.random.default_rng(seed) Generator, so results
+    do not depend on which tests ran before them on the same xdist worker.
+    """
+    key, pos = np.random.get_state()[1:3]
+    yield
+    new_key, new_pos = np.random.get_state()[1:3]
+    assert new_pos == pos and np.array_equal(new_key, key), (
+        "test changed the global np.random state; "
+        "use a local np.random.default_rng(seed) instead"
+    )
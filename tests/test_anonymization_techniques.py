@@ -4,6 +4,7 @@ Unit tests for anonymization techniques.
 Tests hashing, redaction, generalization, and pseudonymization.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 from src.anonymizers.techniques import (
@@ -14,19 +15,51 @@ from src.anonymizers.techniques import (
     AnonymizationTechniques,
 )
 
+# Batches of realistic inputs, built once per module and shared by the
+# parametrized tests below
+SAMPLE_EMAILS = tuple(f"user{i}.name@example{i % 7}.com" for i in range(100))
+SAMPLE_PHONES = tuple(f"({200 + i}) 555-{i:04d}" for i in range(100))
+SAMPLE_SSNS = tuple(f"{100 + i}-{10 + i % 90}-{i:04d}" for i in range(100))
 
-class TestHashingTechnique:
-    """Test hashing-based anonymization."""
 
-    @pytest.fixture
-    def hasher(self):
-        """Create hashing technique instance."""
-        return HashingTechnique()
+@pytest.fixture(scope="module")
+def hasher():
+    """Create hashing technique instance."""
+    return HashingTechnique()
+
+
+@pytest.fixture(scope="module")
+def hasher_with_salt():
+    """Create hashing technique with salt."""
+    return HashingTechnique(salt="test_salt")
+
+
+@pytest.fixture(scope="module")
+def redactor():
+    """Create redaction technique instance."""
+    return RedactionTechnique()
+
 
-    @pytest.fixture
-    def hasher_with_salt(self):
-        """Create hashing technique with salt."""
-        return HashingTechnique(salt="test_salt")
+@pytest.fixture(scope="module")
+def generalizer():
+    """Create generalization technique instance."""
+    return GeneralizationTechnique()
+
+
+@pytest.fixture(scope="module")
+def pseudonymizer():
+    """Create pseudonymization technique instance."""
+    return PseudonymizationTechnique()
+
+
+@pytest.fixture(scope="module")
+def anonymizer():
+    """Create anonymization techniques instance."""
+    return AnonymizationTechniques()
+
+
+class TestHashingTechnique:
+    """Test hashing-based anonymization."""
 
     def test_hash_value_consistent(self, hasher):
         """Test that same value produces same hash."""
@@ -36,6 +69,18 @@ class TestHashingTechnique:
 
         assert hash1 == hash2
 
+    @pytest.mark.parametrize(
+        "values",
+        [SAMPLE_EMAILS, SAMPLE_PHONES, SAMPLE_SSNS],
+        ids=["emails", "phones", "ssns"],
+    )
+    def test_hash_value_consistent_batch(self, hasher, values):
+        """Test hash consistency and uniqueness over a batch of inputs."""
+        hashes = [hasher.hash_value(v) for v in values]
+
+        assert hashes == [hasher.hash_value(v) for v in values]
+        assert len(set(hashes)) == len(values)
+
     def test_hash_value_different_inputs(self, hasher):
         """Test that different values produce different hashes."""
         hash1 = hasher.hash_value("alice@example.com")
@@ -67,7 +112,8 @@ class TestHashingTechnique:
         hash_value = hasher.hash_value("test")
 
         assert len(hash_value) == 64
-        assert all(c in "0123456789abcdef" for c in hash_value)
+        # Round-trips only if the string is lowercase hex with no separators
+        assert bytes.fromhex(hash_value).hex() == hash_value
 
     def test_hash_with_prefix(self, hasher):
         """Test hashing with prefix."""
@@ -85,15 +131,28 @@ class TestHashingTechnique:
         assert hash1 == hash2
         assert isinstance(hash1, str)
 
+    def test_hash_many_matches_hash_value(self, hasher_with_salt):
+        """Test batch hashing agrees with per-value hashing."""
+        values = ["alice@example.com", "", None, 42, "Hello 世界"]
+        expected = [hasher_with_salt.hash_value(v) for v in values]
+
+        assert hasher_with_salt.hash_many(values) == expected
+        assert hasher_with_salt.hash_many(values, salt="other") == [
+            hasher_with_salt.hash_value(v, salt="other") for v in values
+        ]
+
+    def test_hash_many_threaded_matches_serial(self, hasher_with_salt):
+        """Test that splitting a batch across threads keeps order and output."""
+        values = [f"user{i}@example.com" for i in range(50)] + ["x" * 4096]
+
+        assert hasher_with_salt.hash_many(values, max_workers=4) == (
+            hasher_with_salt.hash_many(values)
+        )
+
 
 class TestRedactionTechnique:
     """Test redaction-based anonymization."""
 
-    @pytest.fixture
-    def redactor(self):
-        """Create redaction technique instance."""
-        return RedactionTechnique()
-
     def test_redact_full(self, redactor):
         """Test full redaction."""
         result = redactor.redact_full("John Smith")
@@ -149,6 +208,32 @@ class TestRedactionTechnique:
         result = redactor.redact_partial_credit_card("4532148803436467")
         assert result == "****-****-****-6467"
 
+    @pytest.mark.parametrize(
+        "values, method, mask",
+        [
+            (SAMPLE_PHONES, "redact_partial_phone", "***-***-"),
+            (SAMPLE_SSNS, "redact_partial_ssn", "***-**-"),
+        ],
+        ids=["phones", "ssns"],
+    )
+    def test_redact_partial_batch(self, redactor, values, method, mask):
+        """Test fixed-format masks over a batch of inputs."""
+        redact = getattr(redactor, method)
+        for value in values:
+            assert redact(value) == mask + value[-4:]
+
+    def test_redact_all_mixed_text(self, redactor):
+        """Test single-pass redaction of every PII type in free text."""
+        text = (
+            "Email john.doe@example.com, call (555) 123-4567, "
+            "SSN 123-45-6789, card 4532-1488-0343-6467."
+        )
+        result = redactor.redact_all(text)
+        assert result == (
+            "Email j***@example.com, call ***-***-4567, "
+            "SSN ***-**-6789, card ****-****-****-6467."
+        )
+
     def test_redact_partial_generic(self, redactor):
         """Test generic partial redaction."""
         result = redactor.redact_partial("HelloWorld", keep_start=2, keep_end=2)
@@ -170,11 +255,6 @@ class TestRedactionTechnique:
 class TestGeneralizationTechnique:
     """Test generalization-based anonymization."""
 
-    @pytest.fixture
-    def generalizer(self):
-        """Create generalization technique instance."""
-        return GeneralizationTechnique()
-
     def test_generalize_age_default(self, generalizer):
         """Test age generalization with default range."""
         result = generalizer.generalize_age(34)
@@ -196,6 +276,33 @@ class TestGeneralizationTechnique:
         assert generalizer.generalize_age(5) == "0-9"
         assert generalizer.generalize_age(0) == "0-9"
 
+    def test_generalize_labels_are_shared(self, generalizer):
+        """Test that equal bucket labels are the same string object."""
+        assert generalizer.generalize_age(31) is generalizer.generalize_age(38)
+        assert generalizer.generalize_income(70500) is generalizer.generalize_income(
+            79000
+        )
+        assert generalizer.generalize_age(34.5) == "30.0-39.0"
+
+    def test_generalize_age_many(self, generalizer):
+        """Test column-wise age generalization matches the scalar version."""
+        ages = np.arange(1_000_000)
+        result = generalizer.generalize_age_many(ages, range_size=5)
+
+        assert len(result) == len(ages)
+        for age in (0, 4, 5, 34, 999_999):
+            assert result[age] == generalizer.generalize_age(age, range_size=5)
+
+    def test_generalize_age_many_floats_and_missing(self, generalizer):
+        """Test float ages label like the scalar version and NaN/inf map to None."""
+        ages = np.array([34.5, 39.9, -0.5, np.nan, np.inf])
+        result = generalizer.generalize_age_many(ages)
+
+        for i in range(3):
+            assert result[i] == generalizer.generalize_age(ages[i])
+        assert result[0] == "30.0-39.0"
+        assert result[3] is None and result[4] is None
+
     def test_generalize_zipcode_default(self, generalizer):
         """Test zipcode generalization with default precision."""
         result = generalizer.generalize_zipcode("10001")
@@ -211,6 +318,16 @@ class TestGeneralizationTechnique:
         result = generalizer.generalize_zipcode("10001-1234", precision=3)
         assert "100" in result
 
+    def test_generalize_zipcode_many(self, generalizer):
+        """Test column-wise zipcode generalization matches the scalar version."""
+        zipcodes = np.tile(np.array(["10001", "94105-1234", "12", "02139"]), 250_000)
+        result = generalizer.generalize_zipcode_many(zipcodes)
+
+        assert len(result) == len(zipcodes)
+        for i in range(4):
+            assert result[i] == generalizer.generalize_zipcode(zipcodes[i])
+        assert result[-1] == "021**"
+
     def test_generalize_date_to_quarter(self, generalizer):
         """Test date generalization to quarter."""
         assert generalizer.generalize_date_to_quarter("2024-03-15") == "2024-Q1"
@@ -254,6 +371,25 @@ class TestGeneralizationTechnique:
         result = generalizer.generalize_income(125000)
         assert result == "$120,000-$129,999"
 
+    def test_generalize_income_many(self, generalizer):
+        """Test column-wise income generalization matches the scalar version."""
+        incomes = np.arange(1_000_000) * 0.5
+        result = generalizer.generalize_income_many(incomes, bracket_size=25000)
+
+        assert len(result) == len(incomes)
+        for i in (0, 50_000, 150_001, 999_999):
+            expected = generalizer.generalize_income(incomes[i], bracket_size=25000)
+            assert result[i] == expected
+
+    def test_generalize_income_many_missing_and_negative(self, generalizer):
+        """Test NaN/inf incomes map to None and negatives truncate like int()."""
+        incomes = np.array([np.nan, -10000.5, 75000.9, np.inf])
+        result = generalizer.generalize_income_many(incomes)
+
+        assert result[0] is None and result[3] is None
+        for i in (1, 2):
+            assert result[i] == generalizer.generalize_income(incomes[i])
+
     def test_generalize_numeric_range(self, generalizer):
         """Test generic numeric range generalization."""
         result = generalizer.generalize_numeric_range(45.5, range_size=10)
@@ -263,11 +399,6 @@ class TestGeneralizationTechnique:
 class TestPseudonymizationTechnique:
     """Test pseudonymization-based anonymization."""
 
-    @pytest.fixture
-    def pseudonymizer(self):
-        """Create pseudonymization technique instance."""
-        return PseudonymizationTechnique()
-
     def test_pseudonymize_name_consistency(self, pseudonymizer):
         """Test that same name produces same fake name."""
         name1 = pseudonymizer.pseudonymize_name("John Smith")
@@ -296,6 +427,13 @@ class TestPseudonymizationTechnique:
 
         assert email1 == email2
 
+    def test_pseudonymize_email_batch_consistency(self, pseudonymizer):
+        """Test email pseudonymization consistency over a batch of inputs."""
+        fakes = [pseudonymizer.pseudonymize_email(e) for e in SAMPLE_EMAILS]
+
+        assert fakes == [pseudonymizer.pseudonymize_email(e) for e in SAMPLE_EMAILS]
+        assert all("@" in fake for fake in fakes)
+
     def test_pseudonymize_email_format(self, pseudonymizer):
         """Test that fake email has valid format."""
         fake_email = pseudonymizer.pseudonymize_email("original@example.com")
@@ -341,6 +479,38 @@ class TestPseudonymizationTechnique:
         result = pseudonymizer.pseudonymize_generic("Test", fake_type="email")
         assert "@" in result
 
+    def test_pseudonym_cache_is_bounded(self):
+        """Test that the pseudonym LRU evicts the least recently used entry."""
+        pseudonymizer = PseudonymizationTechnique(cache_size=2)
+        first = pseudonymizer.pseudonymize_name("Alice")
+        pseudonymizer.pseudonymize_name("Bob")
+        pseudonymizer.pseudonymize_name("Alice")
+        pseudonymizer.pseudonymize_name("Carol")
+
+        assert len(pseudonymizer._pseudonym_cache) == 2
+        assert ("name", "Bob") not in pseudonymizer._pseudonym_cache
+        assert pseudonymizer.pseudonymize_name("Alice") == first
+        assert (
+            PseudonymizationTechnique(cache_size=0).pseudonymize_name("Alice") == first
+        )
+
+    def test_pseudonym_cache_distinguishes_equal_values(self):
+        """Test that 1, 1.0 and True each map to their own pseudonym."""
+        pseudonymizer = PseudonymizationTechnique()
+        for value in (1, 1.0, True):
+            pseudonymizer.pseudonymize_name(value)
+
+        for value in (True, 1.0, 1):
+            assert pseudonymizer.pseudonymize_name(value) == PseudonymizationTechnique(
+                cache_size=0
+            ).pseudonymize_name(value)
+
+    def test_pseudonymize_unhashable_value(self, pseudonymizer):
+        """Test that unhashable values are pseudonymized like their string."""
+        result = pseudonymizer.pseudonymize_name([1])
+        assert result == pseudonymizer.pseudonymize_name([1])
+        assert result == pseudonymizer.pseudonymize_name("[1]")
+
     def test_get_seed_consistency(self, pseudonymizer):
         """Test that seed generation is consistent."""
         seed1 = pseudonymizer._get_seed("test value")
@@ -352,11 +522,6 @@ class TestPseudonymizationTechnique:
 class TestAnonymizationTechniques:
     """Test unified anonymization interface."""
 
-    @pytest.fixture
-    def anonymizer(self):
-        """Create anonymization techniques instance."""
-        return AnonymizationTechniques()
-
     def test_unified_interface_has_all_techniques(self, anonymizer):
         """Test that unified interface provides all techniques."""
         assert hasattr(anonymizer, "hashing")
@@ -411,6 +576,13 @@ class TestEdgeCases:
         result = hasher.hash_value(None)
         assert len(result) == 64
 
+    def test_equal_values_of_different_types(self):
+        """Test that 1, 1.0, True and "1" hash as their own string forms."""
+        hasher = HashingTechnique()
+        for value in (1, 1.0, True, "1", 1, True):
+            assert hasher.hash_value(value) == hasher.hash_value(str(value))
+        assert len({hasher.hash_value(v) for v in (1, 1.0, True)}) == 3
+
     def test_very_long_string(self):
         """Test hashing very long string."""
         hasher = HashingTechnique()
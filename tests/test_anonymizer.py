@@ -14,8 +14,7 @@ import pytest
 import pandas as pd
 import numpy as np
 import hashlib
-from pathlib import Path
-import tempfile
+import os
 import yaml  # type: ignore
 
 from src.anonymizer import (
@@ -23,11 +22,12 @@ from src.anonymizer import (
     AnonymizationStrategies,
     AnonymizationError,
     anonymize,
+    _get_anonymizer,
 )
-from src.config_loader import load_config, ConfigLoader
+from src.config_loader import AnonymizationStrategy, ConfigLoader, RuleConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config():
     """Create a sample configuration for testing."""
     config_dict = {
@@ -48,15 +48,7 @@ def sample_config():
         "global": {"handle_nulls": True, "preserve_data_types": True},
     }
 
-    # Create temporary config file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config_dict, f)
-        config_path = Path(f.name)
-
-    config = load_config(config_path)
-    config_path.unlink()  # Clean up
-
-    return config
+    return ConfigLoader.from_dict(config_dict)
 
 
 class TestAnonymizationStrategies:
@@ -90,6 +82,17 @@ class TestAnonymizationStrategies:
         result2 = AnonymizationStrategies.hash_strategy(value, params)
         assert result == result2
 
+    def test_hash_strategy_salted_digest(self):
+        """Test salted hashes are hash(md5(value)[:8] + value)."""
+        value = "test@example.com"
+        params = {"algorithm": "sha256", "salt": True}
+
+        data = value.encode()
+        salt = hashlib.md5(data).hexdigest()[:8].encode()
+        expected = hashlib.sha256(salt + data).hexdigest()
+
+        assert AnonymizationStrategies.hash_strategy(value, params) == expected
+
     def test_hash_strategy_consistency(self):
         """Test that same value produces same hash."""
         value = "test@example.com"
@@ -108,6 +111,20 @@ class TestAnonymizationStrategies:
 
         assert pd.isna(result)
 
+    def test_hash_series_matches_hash_strategy(self):
+        """Test column-level hashing agrees with per-value hashing."""
+        series = pd.Series(["a@example.com", np.nan, "b@example.com", 42])
+
+        for params in (
+            {"algorithm": "sha256", "salt": False},
+            {"algorithm": "sha512", "salt": True},
+        ):
+            result = AnonymizationStrategies.hash_series(series, params)
+            expected = series.apply(
+                lambda x: AnonymizationStrategies.hash_strategy(x, params)
+            )
+            pd.testing.assert_series_equal(result, expected)
+
     def test_redact_full_strategy(self):
         """Test full redaction."""
         value = "sensitive_data"
@@ -126,6 +143,19 @@ class TestAnonymizationStrategies:
 
         assert pd.isna(result)
 
+    def test_redact_full_series_matches_strategy(self):
+        """Test column-level full redaction agrees with per-value redaction."""
+        series = pd.Series(["secret", np.nan, "other", 42])
+        params = {"replacement": "[GONE]"}
+
+        result = AnonymizationStrategies.redact_full_series(series, params)
+        expected = series.apply(
+            lambda x: AnonymizationStrategies.redact_full_strategy(x, params)
+        )
+
+        pd.testing.assert_series_equal(result, expected)
+        assert result.iloc[0] is result.iloc[2]
+
     def test_redact_partial_strategy(self):
         """Test partial redaction."""
         value = "555-1234"
@@ -155,13 +185,27 @@ class TestAnonymizationStrategies:
 
         assert result == "hi"
 
+    def test_redact_partial_series_matches_strategy(self):
+        """Test column-level partial redaction agrees with per-value redaction."""
+        series = pd.Series(["555-1234", np.nan, "hi", "", 5551234])
+
+        for params in (
+            {"visible_chars": 4, "mask_char": "*"},
+            {"visible_chars": 0, "mask_char": "#"},
+        ):
+            result = AnonymizationStrategies.redact_partial_series(series, params)
+            expected = series.apply(
+                lambda x: AnonymizationStrategies.redact_partial_strategy(x, params)
+            )
+            pd.testing.assert_series_equal(result, expected)
+
     def test_pseudonymize_strategy_consistency(self):
         """Test pseudonymization is consistent."""
         value = "John Doe"
         params = {"seed_based": True, "locale": "en_US"}
 
         # Clear cache to ensure fresh start
-        AnonymizationStrategies._pseudo_cache.clear()
+        AnonymizationStrategies._seeded_pseudonym.cache_clear()
 
         result1 = AnonymizationStrategies.pseudonymize_strategy(value, params)
         result2 = AnonymizationStrategies.pseudonymize_strategy(value, params)
@@ -169,12 +213,31 @@ class TestAnonymizationStrategies:
         assert result1 == result2
         assert result1 != value
 
+    def test_pseudonymize_empty_string_unchanged(self):
+        """Test empty strings are not replaced with a fake name."""
+        params = {"seed_based": True, "locale": "en_US"}
+
+        assert AnonymizationStrategies.pseudonymize_strategy("", params) == ""
+
+    def test_pseudonymize_series_matches_strategy(self):
+        """Test column-level pseudonymization agrees with per-value calls."""
+        series = pd.Series(["John", np.nan, "Jane", "", "John", 7])
+        params = {"seed_based": True, "locale": "en_US"}
+
+        result = AnonymizationStrategies.pseudonymize_series(series, params)
+        expected = series.apply(
+            lambda x: AnonymizationStrategies.pseudonymize_strategy(x, params)
+        )
+
+        pd.testing.assert_series_equal(result, expected)
+        assert result.iloc[0] == result.iloc[4]
+
     def test_pseudonymize_different_values_different_results(self):
         """Test different values get different pseudonyms."""
         params = {"seed_based": True, "locale": "en_US"}
 
         # Clear cache
-        AnonymizationStrategies._pseudo_cache.clear()
+        AnonymizationStrategies._seeded_pseudonym.cache_clear()
 
         result1 = AnonymizationStrategies.pseudonymize_strategy("John", params)
         result2 = AnonymizationStrategies.pseudonymize_strategy("Jane", params)
@@ -209,6 +272,20 @@ class TestAnonymizationStrategies:
         result = AnonymizationStrategies.generalize_strategy(-10, params)
         assert result == "0-9"
 
+    def test_generalize_series_matches_generalize_strategy(self):
+        """Test column-level generalization agrees with per-value generalization."""
+        params = {"bin_size": 10, "min_value": 0, "max_value": 100}
+
+        for series in (
+            pd.Series([0, 34, 99.5, 100, 150, -10, np.nan]),
+            pd.Series(["34", "91", None], dtype=object),
+        ):
+            result = AnonymizationStrategies.generalize_series(series, params)
+            expected = series.apply(
+                lambda x: AnonymizationStrategies.generalize_strategy(x, params)
+            )
+            pd.testing.assert_series_equal(result, expected)
+
     def test_generalize_with_nan(self):
         """Test generalization preserves NaN."""
         params = {"bin_size": 10, "min_value": 0, "max_value": 100}
@@ -225,6 +302,33 @@ class TestAnonymizationStrategies:
             AnonymizationStrategies.generalize_strategy("not a number", params)
 
 
+class TestFastHashes:
+    """Test the faster non-SHA2 hash algorithm."""
+
+    def test_hash_strategy_blake2b(self):
+        """Test BLAKE2b hashing with a 32-byte digest."""
+        value = "test@example.com"
+        params = {"algorithm": "blake2b", "salt": False}
+
+        result = AnonymizationStrategies.hash_strategy(value, params)
+
+        assert len(result) == 64  # Same length as SHA256
+        expected = hashlib.blake2b(value.encode(), digest_size=32).hexdigest()
+        assert result == expected
+
+    def test_hash_series_blake2b(self):
+        """Test column-level BLAKE2b hashing agrees with the scalar path."""
+        series = pd.Series(["a@example.com", np.nan, "b@example.com"])
+        params = {"algorithm": "blake2b", "salt": True}
+
+        result = AnonymizationStrategies.hash_series(series, params)
+
+        assert pd.isna(result.iloc[1])
+        assert result.iloc[0] == AnonymizationStrategies.hash_strategy(
+            "a@example.com", params
+        )
+
+
 class TestAnonymizer:
     """Test Anonymizer class."""
 
@@ -247,6 +351,37 @@ class TestAnonymizer:
         assert anonymizer.config == sample_config
         assert anonymizer.global_config is not None
 
+    def test_rules_compiled_on_initialization(self, sample_config):
+        """Test each configured rule is compiled to a column transform once."""
+        anonymizer = Anonymizer(sample_config)
+
+        assert set(anonymizer._compiled_rules) == {"email", "age", "phone"}
+        series = pd.Series(["5551234567", None])
+        expected = AnonymizationStrategies.redact_partial_series(
+            series, sample_config.get_rule("phone").parameters
+        )
+        pd.testing.assert_series_equal(
+            anonymizer._compiled_rules["phone"](series), expected
+        )
+
+    def test_unconfigured_rule_applies_its_own_strategy(self, sample_config, sample_df):
+        """Test a rule other than the configured one is compiled, not swapped."""
+        anonymizer = Anonymizer(sample_config)
+        redact = RuleConfig(
+            "email",
+            AnonymizationStrategy.REDACT_FULL,
+            {"replacement": "[GONE]"},
+        )
+
+        result = anonymizer._anonymize_column(sample_df["email"], redact, "email")
+        assert (result == "[GONE]").all()
+
+        generalize = RuleConfig(
+            "email", AnonymizationStrategy.GENERALIZE, {"bin_size": 10}
+        )
+        with pytest.raises(AnonymizationError, match="Failed to apply generalize"):
+            anonymizer._anonymize_column(sample_df["email"], generalize, "email")
+
     def test_anonymize_dataframe(self, sample_config, sample_df):
         """Test anonymizing a DataFrame."""
         anonymizer = Anonymizer(sample_config)
@@ -302,6 +437,16 @@ class TestAnonymizer:
         # Result should be different
         assert not sample_df["email"].equals(result["email"])
 
+    def test_editing_result_leaves_original_intact(self, sample_config, sample_df):
+        """Test columns shared with the input are not written through."""
+        anonymizer = Anonymizer(sample_config)
+        original_copy = sample_df.copy()
+
+        result = anonymizer.anonymize(sample_df)
+        result.loc[0, "name"] = "Changed"
+
+        pd.testing.assert_frame_equal(sample_df, original_copy)
+
     def test_anonymize_handles_missing_values(self, sample_config):
         """Test handling of missing values."""
         df = pd.DataFrame(
@@ -333,6 +478,33 @@ class TestAnonymizer:
         assert stats["rows_processed"] == 3
         assert len(stats["errors"]) == 0
 
+    def test_threaded_columns_match_sequential(self, sample_config, sample_df):
+        """Test the column thread pool produces the same result as one thread."""
+        sequential = Anonymizer(sample_config, max_workers=1)
+        threaded = Anonymizer(sample_config, max_workers=4)
+        threaded.PARALLEL_MIN_ROWS = 1
+
+        pd.testing.assert_frame_equal(
+            threaded.anonymize(sample_df), sequential.anonymize(sample_df)
+        )
+        assert threaded.get_statistics() == sequential.get_statistics()
+
+    def test_shared_anonymizer_concurrent_statistics(self, sample_config, sample_df):
+        """Test concurrent runs on one Anonymizer keep their statistics separate."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        anonymizer = Anonymizer(sample_config)
+        frames = [pd.concat([sample_df] * n, ignore_index=True) for n in range(1, 9)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(anonymizer.anonymize, frames * 10))
+
+        stats = anonymizer.get_statistics()
+        assert stats["columns_processed"] == 4
+        assert stats["columns_anonymized"] == 3
+        assert stats["rows_processed"] in {len(frame) for frame in frames}
+        assert stats["errors"] == []
+
     def test_anonymizer_repr(self, sample_config):
         """Test string representation."""
         anonymizer = Anonymizer(sample_config)
@@ -356,12 +528,7 @@ class TestConvenienceFunction:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_dict, f)
-            config_path = Path(f.name)
-
-        config = load_config(config_path)
-        config_path.unlink()
+        config = ConfigLoader.from_dict(config_dict)
 
         df = pd.DataFrame({"email": ["test@example.com"]})
 
@@ -369,7 +536,7 @@ class TestConvenienceFunction:
 
         assert result["email"].iloc[0] != df["email"].iloc[0]
 
-    def test_anonymize_function_with_path(self):
+    def test_anonymize_function_with_path(self, tmp_path):
         """Test anonymize function with config path."""
         config_dict = {
             "rules": {
@@ -380,17 +547,43 @@ class TestConvenienceFunction:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_dict, f)
-            config_path = Path(f.name)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_dict))
 
         df = pd.DataFrame({"email": ["test@example.com"]})
 
         result = anonymize(df, config_path)
-        config_path.unlink()
 
         assert result["email"].iloc[0] != df["email"].iloc[0]
 
+    def test_anonymize_function_reuses_anonymizer(self, sample_config):
+        """Test repeated calls with one config share a cached Anonymizer."""
+        df = pd.DataFrame({"email": ["test@example.com"]})
+
+        first = anonymize(df, sample_config)
+        second = anonymize(df, sample_config)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert _get_anonymizer(sample_config) is _get_anonymizer(sample_config)
+
+    def test_anonymize_function_reloads_changed_file(self, tmp_path):
+        """Test a config file is re-read after it is modified."""
+        config_path = tmp_path / "rules.yaml"
+        df = pd.DataFrame({"email": ["test@example.com"]})
+
+        email_rule = {"strategy": "hash", "parameters": {"algorithm": "sha256"}}
+        config_path.write_text(yaml.dump({"rules": {"email": email_rule}}))
+        hashed = anonymize(df, config_path)
+
+        email_rule = {"strategy": "redact_full", "parameters": {}}
+        config_path.write_text(yaml.dump({"rules": {"email": email_rule}}))
+        mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+        redacted = anonymize(df, config_path)
+
+        assert len(hashed["email"].iloc[0]) == 64
+        assert redacted["email"].iloc[0] == "[REDACTED]"
+
 
 class TestDataTypePreservation:
     """Test data type preservation."""
@@ -407,12 +600,7 @@ class TestDataTypePreservation:
             "global": {"preserve_data_types": True},
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_dict, f)
-            config_path = Path(f.name)
-
-        config = load_config(config_path)
-        config_path.unlink()
+        config = ConfigLoader.from_dict(config_dict)
 
         df = pd.DataFrame({"age": [34, 28, 45]})
 
@@ -458,12 +646,7 @@ class TestEdgeCases:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_dict, f)
-            config_path = Path(f.name)
-
-        config = load_config(config_path)
-        config_path.unlink()
+        config = ConfigLoader.from_dict(config_dict)
 
         # DataFrame with different columns
         df = pd.DataFrame({"name": ["John"], "phone": ["555-1234"]})
@@ -9,11 +9,12 @@ Tests cover:
 - Edge cases
 """
 
+import json
 import pytest
+from contextlib import contextmanager
 from pathlib import Path
-import tempfile
 import yaml  # pyright: ignore[reportMissingModuleSource]
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Type
 
 from src.config_loader import (
     ConfigLoader,
@@ -23,8 +24,31 @@ from src.config_loader import (
     load_config,
 )
 
+# libyaml-backed dumper when available, like the loader under test
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
 
-@pytest.fixture
+
+def _write_yaml(config: Dict[str, Any], directory: Path) -> Path:
+    """Write a configuration dictionary to a YAML file in directory."""
+    config_path = directory / "config.yaml"
+    config_path.write_text(yaml.dump(config, Dumper=_Dumper))
+    return config_path
+
+
+@contextmanager
+def raises_containing(
+    exc_type: Type[BaseException], literal: str
+) -> Iterator[pytest.ExceptionInfo]:
+    """Like pytest.raises(match=...), but checks for a literal substring."""
+    with pytest.raises(exc_type) as exc_info:
+        yield exc_info
+    assert literal in str(exc_info.value), f"{literal!r} not in {exc_info.value!r}"
+
+
+@pytest.fixture(scope="session")
 def valid_config() -> Dict[str, Any]:
     """Fixture providing a valid configuration dictionary."""
     return {
@@ -48,17 +72,20 @@ def valid_config() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def temp_config_file(valid_config):
-    """Fixture that creates a temporary config file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(valid_config, f)
-        temp_path = Path(f.name)
+@pytest.fixture(scope="session")
+def temp_config_file(valid_config, tmp_path_factory):
+    """Fixture that writes the valid configuration to a file once per session."""
+    temp_path = tmp_path_factory.mktemp("config") / "valid_config.yaml"
+    with open(temp_path, "w") as f:
+        yaml.dump(valid_config, f, Dumper=_Dumper)
+
+    return temp_path
 
-    yield temp_path
 
-    # Cleanup
-    temp_path.unlink()
+@pytest.fixture(scope="session")
+def loaded_config(temp_config_file) -> ConfigLoader:
+    """Fixture providing the valid configuration, parsed once per session."""
+    return ConfigLoader(temp_config_file).load()
 
 
 class TestConfigLoaderBasics:
@@ -77,30 +104,42 @@ class TestConfigLoaderBasics:
         """Test error handling for missing file."""
         loader = ConfigLoader(Path("/nonexistent/config.yaml"))
 
-        with pytest.raises(ConfigurationError, match="not found"):
+        with raises_containing(ConfigurationError, "not found"):
             loader.load()
 
-    def test_load_invalid_yaml(self):
+    def test_load_invalid_yaml(self, tmp_path):
         """Test error handling for malformed YAML."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("{ invalid: yaml: content:")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text("{ invalid: yaml: content:")
+
+        loader = ConfigLoader(temp_path)
+        with raises_containing(ConfigurationError, "Invalid YAML"):
+            loader.load()
+
+    def test_load_json_config(self, valid_config, loaded_config, tmp_path):
+        """Test a .json configuration loads the same rules as YAML."""
+        json_path = tmp_path / "config.json"
+        json_path.write_text(json.dumps(valid_config))
+
+        loader = ConfigLoader(json_path).load()
+        assert loader.get_all_rules() == loaded_config.get_all_rules()
+
+    def test_load_invalid_json(self, tmp_path):
+        """Test error handling for malformed JSON."""
+        json_path = tmp_path / "config.json"
+        json_path.write_text('{"rules": ')
 
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid YAML"):
-                loader.load()
-        finally:
-            temp_path.unlink()
+        with raises_containing(ConfigurationError, "Invalid JSON"):
+            ConfigLoader(json_path).load()
 
     def test_methods_before_load_raise_error(self, temp_config_file):
         """Test that methods fail before load() is called."""
         loader = ConfigLoader(temp_config_file)
 
-        with pytest.raises(ConfigurationError, match="not loaded"):
+        with raises_containing(ConfigurationError, "not loaded"):
             loader.get_rule("email")
 
-        with pytest.raises(ConfigurationError, match="not loaded"):
+        with raises_containing(ConfigurationError, "not loaded"):
             loader.get_all_rules()
 
     def test_repr(self, temp_config_file):
@@ -119,169 +158,71 @@ class TestConfigLoaderBasics:
 class TestRuleRetrieval:
     """Test rule retrieval and access methods."""
 
-    def test_get_specific_rule(self, temp_config_file):
+    def test_get_specific_rule(self, loaded_config):
         """Test retrieving a specific rule."""
-        loader = ConfigLoader(temp_config_file).load()
-
-        email_rule = loader.get_rule("email")
+        email_rule = loaded_config.get_rule("email")
         assert email_rule is not None
         assert email_rule.pii_type == "email"
         assert email_rule.strategy == AnonymizationStrategy.HASH
         assert email_rule.parameters["algorithm"] == "sha256"
 
-    def test_get_nonexistent_rule(self, temp_config_file):
+    def test_get_nonexistent_rule(self, loaded_config):
         """Test retrieving a rule that doesn't exist."""
-        loader = ConfigLoader(temp_config_file).load()
-
-        rule = loader.get_rule("nonexistent")
+        rule = loaded_config.get_rule("nonexistent")
         assert rule is None
 
-    def test_get_all_rules(self, temp_config_file):
+    def test_get_all_rules(self, loaded_config):
         """Test retrieving all rules."""
-        loader = ConfigLoader(temp_config_file).load()
-
-        all_rules = loader.get_all_rules()
+        all_rules = loaded_config.get_all_rules()
         assert len(all_rules) == 3
         assert "email" in all_rules
         assert "age" in all_rules
         assert "phone" in all_rules
 
-    def test_get_global_config(self, temp_config_file):
+    def test_get_global_config(self, loaded_config):
         """Test retrieving global configuration."""
-        loader = ConfigLoader(temp_config_file).load()
-
-        global_config = loader.get_global_config()
+        global_config = loaded_config.get_global_config()
         assert global_config.handle_nulls is True
         assert global_config.preserve_data_types is True
 
 
-class TestSchemaValidation:
-    """Test configuration schema validation."""
-
-    def test_missing_rules_key(self):
-        """Test error when 'rules' key is missing."""
-        config = {"version": "1.0"}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="missing required keys"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_rules_not_dict(self):
-        """Test error when 'rules' is not a dictionary."""
-        config = {"rules": ["not", "a", "dict"]}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="must be a dictionary"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_invalid_version_type(self):
-        """Test error when version is not a string."""
-        config = {"version": 1.0, "rules": {}}  # Should be string
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Version must be a string"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-
-class TestRuleValidation:
-    """Test individual rule validation."""
-
-    def test_missing_strategy(self):
-        """Test error when a rule is missing the 'strategy' field."""
-        config = {
-            "rules": {
-                "email": {
-                    "parameters": {"algorithm": "sha256"}
-                    # Missing 'strategy'
-                }
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="missing 'strategy'"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_unknown_strategy(self):
-        """Test error when strategy is not recognized."""
-        config = {
-            "rules": {"email": {"strategy": "unknown_strategy", "parameters": {}}}
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Unknown strategy"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_missing_required_parameters(self):
-        """Test error when required parameters are missing for redact_partial."""
-        # Note: generalize with just bin_size is now valid (min_value/max_value optional)
-        # Test with redact_partial which requires visible_chars and mask_char
-        config = {
+# Invalid configurations and the ConfigurationError message each must raise
+BAD_CONFIGS = [
+    pytest.param({"version": "1.0"}, "missing required keys", id="missing_rules_key"),
+    pytest.param(
+        {"rules": ["not", "a", "dict"]}, "must be a dictionary", id="rules_not_dict"
+    ),
+    pytest.param(
+        {"version": 1.0, "rules": {}},  # Should be string
+        "Version must be a string",
+        id="invalid_version_type",
+    ),
+    pytest.param(
+        {"rules": {"email": {"parameters": {"algorithm": "sha256"}}}},
+        "missing 'strategy'",
+        id="missing_strategy",
+    ),
+    pytest.param(
+        {"rules": {"email": {"strategy": "unknown_strategy", "parameters": {}}}},
+        "Unknown strategy",
+        id="unknown_strategy",
+    ),
+    pytest.param(
+        # generalize with just bin_size is valid (min_value/max_value optional),
+        # so use redact_partial, which requires visible_chars and mask_char
+        {
             "rules": {
                 "phone": {
                     "strategy": "redact_partial",
-                    "parameters": {
-                        "visible_chars": 3
-                        # Missing mask_char
-                    },
+                    "parameters": {"visible_chars": 3},  # Missing mask_char
                 }
             }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(
-                ConfigurationError, match="missing required parameters.*mask_char"
-            ):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-
-class TestParameterValidation:
-    """Test validation of parameter values."""
-
-    def test_invalid_bin_size(self):
-        """Test error when bin_size is invalid."""
-        config = {
+        },
+        "missing required parameters for strategy 'redact_partial': {'mask_char'}",
+        id="missing_required_parameters",
+    ),
+    pytest.param(
+        {
             "rules": {
                 "age": {
                     "strategy": "generalize",
@@ -292,22 +233,12 @@ class TestParameterValidation:
                     },
                 }
             }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid bin_size"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_invalid_min_max_range(self):
-        """Test error when min_value >= max_value."""
-        config = {
+        },
+        "Invalid bin_size",
+        id="invalid_bin_size",
+    ),
+    pytest.param(
+        {
             "rules": {
                 "age": {
                     "strategy": "generalize",
@@ -318,22 +249,12 @@ class TestParameterValidation:
                     },
                 }
             }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid range"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_invalid_visible_chars(self):
-        """Test error when visible_chars is invalid."""
-        config = {
+        },
+        "Invalid range",
+        id="invalid_min_max_range",
+    ),
+    pytest.param(
+        {
             "rules": {
                 "phone": {
                     "strategy": "redact_partial",
@@ -343,22 +264,12 @@ class TestParameterValidation:
                     },
                 }
             }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid visible_chars"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_invalid_mask_char(self):
-        """Test error when mask_char is not a single character."""
-        config = {
+        },
+        "Invalid visible_chars",
+        id="invalid_visible_chars",
+    ),
+    pytest.param(
+        {
             "rules": {
                 "phone": {
                     "strategy": "redact_partial",
@@ -368,40 +279,34 @@ class TestParameterValidation:
                     },
                 }
             }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid mask_char"):
-                loader.load()
-        finally:
-            temp_path.unlink()
-
-    def test_invalid_hash_algorithm(self):
-        """Test error when hash algorithm is not allowed."""
-        config = {
+        },
+        "Invalid mask_char",
+        id="invalid_mask_char",
+    ),
+    pytest.param(
+        {
             "rules": {
                 "email": {
                     "strategy": "hash",
                     "parameters": {"algorithm": "sha1"},  # Not in allowed list
                 }
             }
-        }
+        },
+        "Invalid hash algorithm",
+        id="invalid_hash_algorithm",
+    ),
+]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
 
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Invalid hash algorithm"):
-                loader.load()
-        finally:
-            temp_path.unlink()
+class TestValidation:
+    """Test schema, rule and parameter validation."""
+
+    @pytest.mark.parametrize("config,expected_message", BAD_CONFIGS)
+    def test_invalid_config(self, config, expected_message):
+        """Test each invalid configuration is rejected with a clear error."""
+        # Validation is under test, not YAML parsing: skip the file round-trip
+        with raises_containing(ConfigurationError, expected_message):
+            ConfigLoader.from_dict(config)
 
 
 class TestConvenienceFunctions:
@@ -414,6 +319,32 @@ class TestConvenienceFunctions:
         assert config.has_rule("email")
         assert len(config.get_all_rules()) == 3
 
+    def test_load_config_memoized_on_content(self, valid_config, tmp_path):
+        """Test load_config reuses a loader until the file's contents change."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(valid_config, Dumper=_Dumper))
+
+        first = load_config(config_path)
+        assert load_config(config_path) is first
+
+        config_path.write_text(yaml.dump({"rules": {}}, Dumper=_Dumper))
+        reloaded = load_config(config_path)
+
+        assert reloaded is not first
+        assert reloaded.get_all_rules() == {}
+
+    def test_from_dict_matches_file(self, valid_config, loaded_config):
+        """Test ConfigLoader.from_dict builds the same rules as loading YAML."""
+        config = ConfigLoader.from_dict(valid_config)
+
+        assert config.get_all_rules() == loaded_config.get_all_rules()
+        assert config.get_global_config().handle_nulls is True
+
+    def test_from_dict_validates(self):
+        """Test ConfigLoader.from_dict runs schema validation."""
+        with raises_containing(ConfigurationError, "missing required keys"):
+            ConfigLoader.from_dict({"version": "1.0"})
+
     def test_rule_config_dataclass(self):
         """Test RuleConfig dataclass."""
         rule = RuleConfig(
@@ -430,22 +361,17 @@ class TestConvenienceFunctions:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_rules(self):
+    def test_empty_rules(self, tmp_path):
         """Test configuration with no rules."""
         config = {"rules": {}}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
+        temp_path = _write_yaml(config, tmp_path)
 
-        try:
-            loader = ConfigLoader(temp_path).load()
-            assert len(loader.get_all_rules()) == 0
-            assert loader.get_pii_types() == set()
-        finally:
-            temp_path.unlink()
+        loader = ConfigLoader(temp_path).load()
+        assert len(loader.get_all_rules()) == 0
+        assert loader.get_pii_types() == set()
 
-    def test_optional_global_section(self):
+    def test_optional_global_section(self, tmp_path):
         """Test that global section is optional."""
         config = {
             "rules": {
@@ -454,19 +380,14 @@ class TestEdgeCases:
             # No 'global' section
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
+        temp_path = _write_yaml(config, tmp_path)
 
-        try:
-            loader = ConfigLoader(temp_path).load()
-            global_config = loader.get_global_config()
-            # Should use defaults
-            assert global_config.handle_nulls is True
-        finally:
-            temp_path.unlink()
+        loader = ConfigLoader(temp_path).load()
+        global_config = loader.get_global_config()
+        # Should use defaults
+        assert global_config.handle_nulls is True
 
-    def test_optional_parameters_dict(self):
+    def test_optional_parameters_dict(self, tmp_path):
         """Test that parameters dict is optional for strategies with no requirements."""
         config = {
             "rules": {
@@ -477,16 +398,11 @@ class TestEdgeCases:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            temp_path = Path(f.name)
+        temp_path = _write_yaml(config, tmp_path)
 
-        try:
-            loader = ConfigLoader(temp_path).load()
-            rule = loader.get_rule("name")
-            assert rule.parameters == {}
-        finally:
-            temp_path.unlink()
+        loader = ConfigLoader(temp_path).load()
+        rule = loader.get_rule("name")
+        assert rule.parameters == {}
 
 
 if __name__ == "__main__":
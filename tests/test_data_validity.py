@@ -7,11 +7,14 @@ Verifies that generated sample data has:
 - Proper PII types in correct format
 """
 
-import pytest
-import pandas as pd
-import json
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Regex patterns for PII validation
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
@@ -24,121 +27,93 @@ ZIP_PATTERN = re.compile(r"^\d{5}(-\d{4})?$")
 IP_ADDRESS_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
 DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+_REQUIRED_CUSTOMER_COLUMNS = frozenset(
+    {
+        "name",
+        "email",
+        "phone",
+        "ssn",
+        "address",
+        "city",
+        "state",
+        "zip",
+        "dob",
+        "income",
+    }
+)
+_MIN_CUSTOMER_ROWS = 100
+
+
+def _assert_all_match(series: "pd.Series", pattern: re.Pattern, name: str) -> None:
+    """Assert every value in the column matches pattern, in one vectorized pass."""
+    matches = series.astype(str).str.match(pattern)
+    invalid = series[~matches]
+    assert (
+        invalid.empty
+    ), f"Found {len(invalid)} invalid {name}: {invalid.head().tolist()}"
+
+
+@pytest.fixture(scope="session")
+def customers_df():
+    """Load customers.csv as a pandas DataFrame, once per session (read-only)"""
+    import pandas as pd
+
+    fixture_path = Path("fixtures/customers.csv")
+    assert fixture_path.exists(), "fixtures/customers.csv not found"
+    return pd.read_csv(fixture_path, dtype={"zip": str})
+
 
 class TestCustomersCSV:
     """Test suite for customers.csv fixture"""
 
-    @pytest.fixture
-    def customers_df(self):
-        """Load customers.csv as a pandas DataFrame"""
-        fixture_path = Path("fixtures/customers.csv")
-        assert fixture_path.exists(), "fixtures/customers.csv not found"
-        return pd.read_csv(fixture_path, dtype={"zip": str})
-
-    def test_minimum_row_count(self, customers_df):
-        """Verify at least 1000 rows are present"""
-        required_columns = [
-            "name",
-            "email",
-            "phone",
-            "ssn",
-            "address",
-            "city",
-            "state",
-            "zip",
-            "dob",
-            "income",
-        ]
-        missing_columns = set(required_columns) - set(customers_df.columns)
+    def test_required_columns_present(self, customers_df):
+        """Verify all required columns and the minimum row count are present"""
+        missing_columns = _REQUIRED_CUSTOMER_COLUMNS - set(customers_df.columns)
         assert not missing_columns, f"Missing columns: {missing_columns}"
+        assert (
+            len(customers_df) >= _MIN_CUSTOMER_ROWS
+        ), f"Expected at least {_MIN_CUSTOMER_ROWS} rows, got {len(customers_df)}"
 
     def test_no_null_values_in_pii_fields(self, customers_df):
         """Verify no null values in PII fields"""
         pii_fields = ["name", "email", "phone", "ssn"]
-        for field in pii_fields:
-            null_count = customers_df[field].isnull().sum()
-            assert null_count == 0, f"Field '{field}' has null values"
+        has_nulls = customers_df[pii_fields].isnull().any()
+        assert (
+            not has_nulls.any()
+        ), f"Fields with null values: {has_nulls[has_nulls].index.tolist()}"
 
     def test_email_format(self, customers_df):
         """Verify emails are in valid format."""
-        sample_size = min(100, len(customers_df))
-        sample_emails = customers_df["email"].sample(sample_size)
-
-        invalid_emails = []
-        for email in sample_emails:
-            if not EMAIL_PATTERN.match(str(email)):
-                invalid_emails.append(email)
-
-        assert (
-            len(invalid_emails) == 0
-        ), f"Found {len(invalid_emails)} invalid emails: {invalid_emails[:5]}"
+        _assert_all_match(customers_df["email"], EMAIL_PATTERN, "emails")
 
     def test_phone_format(self, customers_df):
         """Verify phone numbers are in valid US format."""
-        sample_size = min(100, len(customers_df))
-        sample_phones = customers_df["phone"].sample(sample_size)
-
-        invalid_phones = []
-        for phone in sample_phones:
-            if not PHONE_PATTERN.match(str(phone)):
-                invalid_phones.append(phone)
-
-        assert (
-            len(invalid_phones) == 0
-        ), f"Found {len(invalid_phones)} invalid phone numbers: {invalid_phones[:5]}"
+        _assert_all_match(customers_df["phone"], PHONE_PATTERN, "phone numbers")
 
     def test_ssn_format(self, customers_df):
         """Verify SSNs are in valid format (XXX-XX-XXXX)."""
-        sample_size = min(100, len(customers_df))
-        sample_ssns = customers_df["ssn"].sample(sample_size)
-
-        invalid_ssns = []
-        for ssn in sample_ssns:
-            if not SSN_PATTERN.match(str(ssn)):
-                invalid_ssns.append(ssn)
-
-        assert (
-            len(invalid_ssns) == 0
-        ), f"Found {len(invalid_ssns)} invalid SSNs: {invalid_ssns[:5]}"
+        _assert_all_match(customers_df["ssn"], SSN_PATTERN, "SSNs")
 
     def test_zip_format(self, customers_df):
         """Verify zip codes are in valid format (XXXXX or XXXXX-XXXX)."""
-        sample_size = min(100, len(customers_df))
-        sample_zips = customers_df["zip"].sample(sample_size)
-
-        invalid_zips = []
-        for zipcode in sample_zips:
-            if not ZIP_PATTERN.match(str(zipcode)):
-                invalid_zips.append(zipcode)
-
-        assert (
-            len(invalid_zips) == 0
-        ), f"Found {len(invalid_zips)} invalid zip codes: {invalid_zips[:5]}"
+        _assert_all_match(customers_df["zip"], ZIP_PATTERN, "zip codes")
 
     def test_dob_format(self, customers_df):
         """Verify dates of birth are in valid format (YYYY-MM-DD)."""
-        sample_size = min(100, len(customers_df))
-        sample_dobs = customers_df["dob"].sample(sample_size)
-
-        invalid_dobs = []
-        for dob in sample_dobs:
-            if not DATE_PATTERN.match(str(dob)):
-                invalid_dobs.append(dob)
-
-        assert (
-            len(invalid_dobs) == 0
-        ), f"Found {len(invalid_dobs)} invalid dates: {invalid_dobs[:5]}"
+        _assert_all_match(customers_df["dob"], DATE_PATTERN, "dates")
 
     def test_name_is_non_empty(self, customers_df):
         """Verify names are non-empty strings."""
-        assert customers_df["name"].str.len().min() > 0, "Found empty names"
+        assert not customers_df["name"].eq("").any(), "Found empty names"
 
     def test_address_is_non_empty(self, customers_df):
         """Verify addresses are non-empty strings."""
-        assert customers_df["address"].str.len().min() > 0, "Found empty addresses"
+        assert not customers_df["address"].eq("").any(), "Found empty addresses"
 
     def test_income_is_numeric(self, customers_df):
         """Verify income values are numeric and positive."""
+        import pandas as pd
+
         assert pd.api.types.is_numeric_dtype(
             customers_df["income"]
         ), "Income should be numeric"
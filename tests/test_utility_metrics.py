@@ -9,6 +9,8 @@ Tests cover:
 - Error handling
 """
 
+import importlib.util
+
 import pytest
 import pandas as pd
 import numpy as np
@@ -24,96 +26,163 @@ from src.utility_metrics import (
     compare_utility,
 )
 
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark not installed",
+)
 
-class TestDistributionMetrics:
-    """Test distribution metrics dataclass."""
+# Samples shared by read-only tests, drawn once at import from a seeded Generator
+_RNG = np.random.default_rng(42)
+_AGE_SAMPLE_A = _RNG.normal(40, 10, 100)
+_AGE_SAMPLE_B = _RNG.normal(40, 10, 100)
+
+
+@pytest.fixture(scope="module")
+def identical_normal_df():
+    """Original and (identical) anonymized frames of normal age/income data."""
+    rng = np.random.default_rng(42)
+    # Fill one preallocated buffer in place, then scale each column to
+    # age ~ N(40, 10) and income ~ N(50000, 15000)
+    values = np.empty((100, 2))
+    rng.standard_normal(out=values)
+    values *= (10, 15000)
+    values += (40, 50000)
+    df = pd.DataFrame(values, columns=["age", "income"], copy=False)
+    return df, df.copy()
+
+
+@pytest.fixture(scope="module")
+def metrics_identical(identical_normal_df):
+    """UtilityMetrics comparing identical frames (read-only)."""
+    return UtilityMetrics(*identical_normal_df)
+
+
+@pytest.fixture(scope="module")
+def correlated_pair_dfs():
+    """Highly correlated columns, and the same columns with small added noise."""
+    rng = np.random.default_rng(42)
+    n = 100
+    x = rng.normal(0, 1, n)
+    y = x + rng.normal(0, 0.1, n)  # Highly correlated
+
+    df1 = pd.DataFrame({"a": x, "b": y})
+    df2 = pd.DataFrame(
+        {
+            "a": x + rng.normal(0, 0.05, n),
+            "b": y + rng.normal(0, 0.05, n),
+        }
+    )
+    return df1, df2
+
+
+@pytest.fixture(scope="module")
+def poor_utility_dfs():
+    """Frames where every anonymized column collapsed to a single value."""
+    df1 = pd.DataFrame(
+        {
+            "age": [20, 30, 40, 50, 60],
+            "income": [30000, 50000, 70000, 90000, 110000],
+        }
+    )
+    df2 = pd.DataFrame(
+        {
+            "age": [100, 100, 100, 100, 100],  # All same
+            "income": [0, 0, 0, 0, 0],  # All same
+        }
+    )
+    return df1, df2
+
+
+@pytest.fixture(scope="module")
+def metrics_poor(poor_utility_dfs):
+    """UtilityMetrics for the collapsed frames (read-only)."""
+    return UtilityMetrics(*poor_utility_dfs)
 
-    def test_distribution_metrics_excellent(self):
-        """Test interpretation for excellent preservation."""
-        metrics = DistributionMetrics(
-            ks_statistic=0.05,
-            ks_pvalue=0.9,
-            mean_absolute_diff=1.0,
-            median_absolute_diff=0.5,
-            std_ratio=0.98,
-            interpretation="",
-        )
 
-        assert "Excellent" in metrics.interpretation
-        assert ">90%" in metrics.interpretation
+class TestDistributionMetrics:
+    """Test distribution metrics dataclass."""
 
-    def test_distribution_metrics_poor(self):
-        """Test interpretation for poor preservation."""
+    @pytest.mark.parametrize(
+        "ks,pvalue,mean_diff,median_diff,std_ratio,expected",
+        [
+            pytest.param(
+                0.05,
+                0.9,
+                1.0,
+                0.5,
+                0.98,
+                "Excellent preservation (>90%)",
+                id="excellent",
+            ),
+            pytest.param(0.4, 0.01, 10.0, 8.0, 0.5, "Poor", id="poor"),
+        ],
+    )
+    def test_distribution_metrics_interpretation(
+        self, ks, pvalue, mean_diff, median_diff, std_ratio, expected
+    ):
+        """Test interpretation follows the KS statistic."""
         metrics = DistributionMetrics(
-            ks_statistic=0.4,
-            ks_pvalue=0.01,
-            mean_absolute_diff=10.0,
-            median_absolute_diff=8.0,
-            std_ratio=0.5,
+            ks_statistic=ks,
+            ks_pvalue=pvalue,
+            mean_absolute_diff=mean_diff,
+            median_absolute_diff=median_diff,
+            std_ratio=std_ratio,
             interpretation="",
         )
 
-        assert "Poor" in metrics.interpretation
+        assert expected in metrics.interpretation
 
 
 class TestCorrelationMetrics:
     """Test correlation metrics dataclass."""
 
-    def test_correlation_metrics_excellent(self):
-        """Test interpretation for excellent correlation preservation."""
+    @pytest.mark.parametrize(
+        "distance,similarity,mean_diff,max_diff,expected",
+        [
+            pytest.param(0.05, 0.95, 0.02, 0.05, "Excellent", id="excellent"),
+            pytest.param(0.5, 0.5, 0.2, 0.4, "Poor", id="poor"),
+        ],
+    )
+    def test_correlation_metrics_interpretation(
+        self, distance, similarity, mean_diff, max_diff, expected
+    ):
+        """Test interpretation follows the correlation similarity."""
         metrics = CorrelationMetrics(
-            correlation_distance=0.05,
-            correlation_similarity=0.95,
-            mean_absolute_difference=0.02,
-            max_absolute_difference=0.05,
+            correlation_distance=distance,
+            correlation_similarity=similarity,
+            mean_absolute_difference=mean_diff,
+            max_absolute_difference=max_diff,
             interpretation="",
         )
 
-        assert "Excellent" in metrics.interpretation
-
-    def test_correlation_metrics_poor(self):
-        """Test interpretation for poor correlation preservation."""
-        metrics = CorrelationMetrics(
-            correlation_distance=0.5,
-            correlation_similarity=0.5,
-            mean_absolute_difference=0.2,
-            max_absolute_difference=0.4,
-            interpretation="",
-        )
-
-        assert "Poor" in metrics.interpretation
+        assert expected in metrics.interpretation
 
 
 class TestInformationLossMetrics:
     """Test information loss metrics dataclass."""
 
-    def test_information_loss_minimal(self):
-        """Test interpretation for minimal information loss."""
-        metrics = InformationLossMetrics(
-            unique_values_original=100,
-            unique_values_anonymized=95,
-            unique_values_retained_pct=95.0,
-            entropy_original=6.0,
-            entropy_anonymized=5.8,
-            entropy_retained_pct=96.7,
-            interpretation="",
-        )
-
-        assert "Minimal" in metrics.interpretation
-
-    def test_information_loss_high(self):
-        """Test interpretation for high information loss."""
+    @pytest.mark.parametrize(
+        "unique_anonymized,unique_pct,entropy_anonymized,entropy_pct,expected",
+        [
+            pytest.param(95, 95.0, 5.8, 96.7, "Minimal", id="minimal"),
+            pytest.param(20, 20.0, 2.0, 33.3, "High", id="high"),
+        ],
+    )
+    def test_information_loss_interpretation(
+        self, unique_anonymized, unique_pct, entropy_anonymized, entropy_pct, expected
+    ):
+        """Test interpretation follows the average retention."""
         metrics = InformationLossMetrics(
             unique_values_original=100,
-            unique_values_anonymized=20,
-            unique_values_retained_pct=20.0,
+            unique_values_anonymized=unique_anonymized,
+            unique_values_retained_pct=unique_pct,
             entropy_original=6.0,
-            entropy_anonymized=2.0,
-            entropy_retained_pct=33.3,
+            entropy_anonymized=entropy_anonymized,
+            entropy_retained_pct=entropy_pct,
             interpretation="",
         )
 
-        assert "High" in metrics.interpretation
+        assert expected in metrics.interpretation
 
 
 class TestUtilityMetricsInitialization:
@@ -126,8 +195,9 @@ class TestUtilityMetricsInitialization:
 
         metrics = UtilityMetrics(df1, df2)
 
-        assert metrics.original.equals(df1)
-        assert metrics.anonymized.equals(df2)
+        # The calculator holds references to its inputs rather than copies
+        assert metrics.original is df1
+        assert metrics.anonymized is df2
 
     def test_initialization_different_shapes_raises_error(self):
         """Test error when DataFrames have different shapes."""
@@ -173,15 +243,69 @@ class TestDistributionPreservation:
         metrics = UtilityMetrics(df1, df2)
         dist_metrics = metrics.calculate_distribution_preservation("age")
 
-        assert dist_metrics.ks_statistic == 0.0  # Perfect match
+        # Perfect match
+        assert dist_metrics.ks_statistic == pytest.approx(0.0, abs=1e-12)
+        assert dist_metrics.mean_absolute_diff == pytest.approx(0.0, abs=1e-12)
+        assert dist_metrics.median_absolute_diff == pytest.approx(0.0, abs=1e-12)
+
+    def test_identical_float_distributions(self):
+        """Test that identical float data compares equal after downcasting."""
+        rng = np.random.default_rng(3)
+        df1 = pd.DataFrame({"income": rng.normal(50000, 15000, 500)})
+        df2 = df1.copy()
+
+        metrics = UtilityMetrics(df1, df2)
+        dist_metrics = metrics.calculate_distribution_preservation("income")
+
+        assert dist_metrics.ks_statistic == 0.0
+        assert dist_metrics.ks_pvalue == 1.0
         assert dist_metrics.mean_absolute_diff == 0.0
         assert dist_metrics.median_absolute_diff == 0.0
+        assert dist_metrics.std_ratio == 1.0
+
+    def test_large_offset_std_ratio(self):
+        """Test that spread is measured relative to the mean, not its magnitude."""
+        rng = np.random.default_rng(13)
+        noise = rng.normal(0, 1, 1000)
+        df1 = pd.DataFrame({"value": 1e7 + noise})
+        df2 = pd.DataFrame({"value": 1e7 + 2 * noise})
+
+        dist_metrics = UtilityMetrics(df1, df2).calculate_distribution_preservation(
+            "value"
+        )
+
+        assert dist_metrics.std_ratio == pytest.approx(2.0, rel=1e-3)
+
+    @pytest.mark.parametrize(
+        "original,anonymized,expected_ks",
+        [
+            pytest.param(
+                1e9 + np.arange(100.0), 1e9 + np.arange(100.0) + 1e-3, 0.01, id="1e9"
+            ),
+            pytest.param(
+                np.array([10**17 + 3, 2 * 10**17 + 5, 3 * 10**17 + 7]),
+                np.array([10**17 + 3, 2 * 10**17 + 1005, 3 * 10**17 + 7]),
+                1 / 3,
+                id="1e17-ids",
+            ),
+        ],
+    )
+    def test_large_offset_changes_detected(self, original, anonymized, expected_ks):
+        """Test that small changes to large-magnitude values aren't rounded away."""
+        df1 = pd.DataFrame({"value": original, "other": np.arange(len(original))})
+        df2 = pd.DataFrame({"value": anonymized, "other": np.arange(len(original))})
+
+        metrics = UtilityMetrics(df1, df2)
+        single = metrics.calculate_distribution_preservation("value")
+        table = metrics.generate_report().distribution_metrics
+
+        assert single.ks_statistic == pytest.approx(expected_ks)
+        assert table.loc["value", "ks_statistic"] == pytest.approx(expected_ks)
 
     def test_similar_distributions(self):
         """Test metrics for similar distributions."""
-        np.random.seed(42)
-        df1 = pd.DataFrame({"age": np.random.normal(40, 10, 100)})
-        df2 = pd.DataFrame({"age": np.random.normal(40, 10, 100)})
+        df1 = pd.DataFrame({"age": _AGE_SAMPLE_A})
+        df2 = pd.DataFrame({"age": _AGE_SAMPLE_B})
 
         metrics = UtilityMetrics(df1, df2)
         dist_metrics = metrics.calculate_distribution_preservation("age")
@@ -234,43 +358,54 @@ class TestDistributionPreservation:
         with pytest.raises(UtilityMetricsError):
             metrics.calculate_distribution_preservation("name")
 
+    def test_sorted_summary_stats(self):
+        """Test sorted-array mean/median/std against numpy."""
+        rng = np.random.default_rng(5)
+        values = np.sort(rng.normal(50000, 15000, 501).astype(np.float32))
+
+        mean, median, std = UtilityMetrics._sorted_summary_stats(values)
+
+        assert mean == pytest.approx(np.mean(values, dtype=np.float64))
+        assert median == pytest.approx(np.median(values))
+        assert std == pytest.approx(np.std(values, ddof=1, dtype=np.float64))
+
+        # Large offset, small spread: no cancellation in the variance
+        offset = np.sort((1e7 + rng.normal(0, 0.99, 1000)).astype(np.float32))
+        _, _, offset_std = UtilityMetrics._sorted_summary_stats(offset)
+        assert offset_std == pytest.approx(np.std(offset, ddof=1, dtype=np.float64))
+
+        single = UtilityMetrics._sorted_summary_stats(np.array([4.0]))
+        assert single[:2] == (4.0, 4.0)
+        assert np.isnan(single[2])
+
+    def test_parse_generalized_range(self):
+        """Test parsing of generalized range strings."""
+        parse = UtilityMetrics._parse_generalized_range
+
+        assert parse("45-49") == 47.0
+        assert parse(" 90000 - 94999 ") == 92499.5
+        assert parse("-5--1") == -3.0
+        assert parse("45") == 45.0
+        assert parse(12) == 12.0
+        assert parse(np.nan) is None
+        assert parse("2020-01-15") is None
+        assert parse("unknown") is None
+
 
 class TestCorrelationPreservation:
     """Test correlation preservation metrics."""
 
-    def test_identical_correlations(self):
+    def test_identical_correlations(self, metrics_identical):
         """Test metrics for identical correlations."""
-        np.random.seed(42)
-        df = pd.DataFrame(
-            {"a": np.random.normal(0, 1, 100), "b": np.random.normal(0, 1, 100)}
-        )
-
-        metrics = UtilityMetrics(df, df)
-        corr_metrics = metrics.calculate_correlation_preservation()
+        corr_metrics = metrics_identical.calculate_correlation_preservation()
 
         assert corr_metrics.correlation_distance < 0.01  # Nearly 0
         assert corr_metrics.correlation_similarity > 0.99
+        assert corr_metrics.max_absolute_difference == 0.0
 
-    def test_preserved_correlations(self):
+    def test_preserved_correlations(self, correlated_pair_dfs):
         """Test correlation preservation with slight changes."""
-        np.random.seed(42)
-        n = 100
-
-        # Create correlated data
-        x = np.random.normal(0, 1, n)
-        y = x + np.random.normal(0, 0.1, n)  # Highly correlated
-
-        df1 = pd.DataFrame({"a": x, "b": y})
-
-        # Add small noise
-        df2 = pd.DataFrame(
-            {
-                "a": x + np.random.normal(0, 0.05, n),
-                "b": y + np.random.normal(0, 0.05, n),
-            }
-        )
-
-        metrics = UtilityMetrics(df1, df2)
+        metrics = UtilityMetrics(*correlated_pair_dfs)
         corr_metrics = metrics.calculate_correlation_preservation()
 
         # Should be well preserved
@@ -297,6 +432,68 @@ class TestCorrelationPreservation:
 
         assert corr_metrics is not None
 
+    def test_correlation_skips_incomplete_rows(self):
+        """Test that missing values are excluded pairwise from correlation."""
+        df1 = pd.DataFrame(
+            {"a": [1.0, 2.0, np.nan, 4.0, 5.0], "b": [2.0, 4.0, 6.0, 8.0, 10.0]}
+        )
+        df2 = pd.DataFrame(
+            {"a": ["0-2", "0-2", "2-4", np.nan, "4-6"], "b": [2, 4, 6, 8, 10]}
+        )
+
+        metrics = UtilityMetrics(df1, df2)
+        corr_metrics = metrics.calculate_correlation_preservation()
+
+        # Each side correlates the rows where both columns are present
+        assert corr_metrics.max_absolute_difference < 0.05
+
+    def test_correlation_ignores_hashed_numeric_column(self):
+        """Test that a numeric ID hashed to strings doesn't drop all rows."""
+        rng = np.random.default_rng(0)
+        n = 100
+        age = rng.integers(18, 80, n)
+        df1 = pd.DataFrame(
+            {
+                "customer_id": np.arange(n),
+                "age": age,
+                "income": age * 1000 + rng.normal(0, 5000, n),
+            }
+        )
+        df2 = df1.assign(customer_id=[f"h{i:015x}" for i in range(n)])
+
+        corr_metrics = UtilityMetrics(df1, df2).generate_report().correlation_metrics
+
+        assert corr_metrics is not None
+        assert corr_metrics.correlation_similarity == pytest.approx(1.0)
+
+    def test_correlation_distance_matches_scipy(self):
+        """Test inlined correlation distance against scipy's implementation."""
+        from scipy.spatial.distance import correlation  # type: ignore
+
+        rng = np.random.default_rng(7)
+        n = 200
+        x = rng.normal(0, 1, n)
+        df1 = pd.DataFrame(
+            {
+                "a": x,
+                "b": x + rng.normal(0, 0.5, n),
+                "c": rng.normal(0, 1, n),
+                "d": -x + rng.normal(0, 1, n),
+            }
+        )
+        df2 = df1 + rng.normal(0, 0.8, df1.shape)
+
+        metrics = UtilityMetrics(df1, df2)
+        corr_metrics = metrics.calculate_correlation_preservation()
+
+        upper = np.triu_indices(4, k=1)
+        expected = correlation(
+            df1.corr().to_numpy()[upper], df2.corr().to_numpy()[upper]
+        )
+
+        # Correlation matrices are computed in float32
+        assert corr_metrics.correlation_distance == pytest.approx(expected, rel=1e-4)
+
 
 class TestInformationLoss:
     """Test information loss metrics."""
@@ -337,7 +534,8 @@ class TestInformationLoss:
         info_metrics = metrics.calculate_information_loss("value")
 
         assert info_metrics.unique_values_anonymized == 1
-        assert info_metrics.entropy_anonymized == 0.0  # No entropy
+        # No entropy
+        assert info_metrics.entropy_anonymized == pytest.approx(0.0, abs=1e-12)
 
     def test_information_loss_with_missing_values(self):
         """Test information loss with NaN values."""
@@ -362,28 +560,111 @@ class TestInformationLoss:
 
         assert entropy1 > entropy2
 
+    def test_entropy_across_dtypes(self):
+        """Test entropy for numeric, string and mixed-type columns."""
+        expected = stats.entropy([3, 2, 1], base=2)
+
+        numeric = pd.Series([1.5, 1.5, 1.5, 2.0, 2.0, 7.0])
+        strings = pd.Series(["a", "a", "a", "b", "b", "c"])
+        mixed = pd.Series(["a", "a", "a", 2, 2, None, 3.5])
+
+        assert UtilityMetrics._calculate_entropy(numeric) == pytest.approx(expected)
+        assert UtilityMetrics._calculate_entropy(strings) == pytest.approx(expected)
+        assert UtilityMetrics._calculate_entropy(mixed) == pytest.approx(expected)
+
+    def test_fused_entropies_match_scipy(self):
+        """Test batched entropy matches scipy per count array, empties included."""
+        counts_list = [
+            np.array([3, 2, 1]),
+            np.array([], dtype=np.int64),
+            np.array([5]),
+            np.array([1, 1, 1, 1]),
+        ]
+
+        entropies = UtilityMetrics._entropies_from_counts(counts_list)
+
+        assert entropies.tolist() == pytest.approx(
+            [stats.entropy([3, 2, 1], base=2), 0.0, 0.0, 2.0]
+        )
+
 
 class TestReportGeneration:
     """Test comprehensive report generation."""
 
-    def test_generate_report_basic(self):
+    def test_generate_report_basic(self, metrics_identical):
         """Test basic report generation."""
-        np.random.seed(42)
+        report = metrics_identical.generate_report()
+
+        assert report.overall_utility_score > 90  # Should be excellent
+        assert len(report.distribution_metrics) > 0
+        assert report.correlation_metrics is not None
+        assert len(report.information_loss_metrics) > 0
+
+    def test_distribution_metrics_table(self):
+        """Test that distribution metrics are reported as one table."""
         df1 = pd.DataFrame(
+            {"age": [20, 30, 40, 50, 60], "score": [1, 2, 3, 4, 5], "c": list("abcde")}
+        )
+        df2 = pd.DataFrame(
             {
-                "age": np.random.normal(40, 10, 100),
-                "income": np.random.normal(50000, 15000, 100),
+                "age": [100, 110, 120, 130, 140],
+                "score": [1, 2, 3, 4, 5],
+                "c": list("abcde"),
             }
         )
-        df2 = df1.copy()  # Identical
 
-        metrics = UtilityMetrics(df1, df2)
-        report = metrics.generate_report()
+        report = UtilityMetrics(df1, df2).generate_report()
+        table = report.distribution_metrics
 
-        assert report.overall_utility_score > 90  # Should be excellent
-        assert len(report.distribution_metrics) > 0
-        assert report.correlation_metrics is not None
-        assert len(report.information_loss_metrics) > 0
+        assert list(table.index) == ["age", "score"]
+        assert "Poor" in table.loc["age", "interpretation"]
+        assert "Excellent" in table.loc["score", "interpretation"]
+
+        # Single-column access still returns the dataclass
+        age_metrics = report.get_distribution_metrics("age")
+        assert isinstance(age_metrics, DistributionMetrics)
+        assert age_metrics.ks_statistic == table.loc["age", "ks_statistic"]
+        assert "Poor" in age_metrics.interpretation
+
+    def test_report_distribution_matches_single_column(self):
+        """Test that batched distribution metrics match per-column results."""
+        rng = np.random.default_rng(11)
+        n = 200
+        df1 = pd.DataFrame(
+            {
+                "age": rng.normal(40, 10, n),
+                "income": rng.normal(50000, 15000, n),
+                "score": rng.normal(0, 1, n),
+                "rating": rng.normal(5, 2, n),
+                "missing": [np.nan] * n,
+            }
+        )
+        df1.loc[::7, "age"] = np.nan
+        df2 = df1.copy()
+        decade = df1["age"] // 10 * 10
+        df2["age"] = [
+            np.nan if np.isnan(v) else f"{int(v)}-{int(v) + 9}" for v in decade
+        ]
+        df2["income"] = df1["income"].round(-3)
+        df2.loc[::5, "income"] = np.nan
+        # Complete columns on both sides take the vectorized KS path
+        df2["score"] = df1["score"].round(1)
+        df2["rating"] = df1["rating"] + 0.5
+
+        metrics = UtilityMetrics(df1, df2)
+        table = metrics.generate_report().distribution_metrics
+
+        assert list(table.index) == ["age", "income", "score", "rating"]
+        for col in table.index:
+            single = metrics.calculate_distribution_preservation(col)
+            for field in [
+                "ks_statistic",
+                "ks_pvalue",
+                "mean_absolute_diff",
+                "median_absolute_diff",
+                "std_ratio",
+            ]:
+                assert table.loc[col, field] == pytest.approx(getattr(single, field))
 
     def test_generate_report_with_column_selection(self):
         """Test report with specific columns."""
@@ -396,6 +677,73 @@ class TestReportGeneration:
         assert "a" in report.information_loss_metrics
         assert "b" in report.information_loss_metrics
 
+    def test_generate_report_memoized_per_selection(self):
+        """Test repeated reports for the same columns are reused."""
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        metrics = UtilityMetrics(df, df)
+        report = metrics.generate_report()
+
+        again = metrics.generate_report(["a", "b"])
+        assert again is not report
+        assert again.overall_utility_score == report.overall_utility_score
+        assert len(metrics._report_cache) == 1
+        assert list(metrics.generate_report(["a"]).information_loss_metrics) == ["a"]
+        assert len(metrics._report_cache) == 2
+
+    def test_generate_report_returns_independent_copies(self):
+        """Test editing a returned report leaves later reports untouched."""
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        metrics = UtilityMetrics(df, df)
+        report = metrics.generate_report()
+        expected = UtilityMetrics(df, df).generate_report()
+
+        report.distribution_metrics.loc["a", "mean_diff"] = 99.0
+        report.information_loss_metrics.clear()
+        report.column_level_scores["a"] = 0.0
+        report.recommendations.append("edited")
+        report.overall_utility_score = 0.0
+
+        again = metrics.generate_report()
+        pd.testing.assert_frame_equal(
+            again.distribution_metrics, expected.distribution_metrics
+        )
+        assert again.information_loss_metrics == expected.information_loss_metrics
+        assert again.column_level_scores == expected.column_level_scores
+        assert again.recommendations == expected.recommendations
+        assert again.overall_utility_score == expected.overall_utility_score
+
+    def test_small_report_skips_thread_pool(self, monkeypatch):
+        """Test reports on short frames are computed without a thread pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("thread pool created for a small report")
+
+        monkeypatch.setattr("src.utility_metrics.ThreadPoolExecutor", no_pool)
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        report = UtilityMetrics(df, df).generate_report()
+        assert set(report.information_loss_metrics) == {"a", "b"}
+
+    def test_threaded_report_matches_serial(self, identical_normal_df, monkeypatch):
+        """Test the thread pool produces the same report as the serial path."""
+        monkeypatch.setattr("src.utility_metrics.os.cpu_count", lambda: 4)
+        original, _ = identical_normal_df
+        anonymized = original.copy()
+        anonymized["age"] = anonymized["age"] // 10 * 10
+
+        serial = UtilityMetrics(original, anonymized).generate_report()
+        metrics = UtilityMetrics(original, anonymized)
+        metrics.PARALLEL_MIN_ROWS = 1
+        threaded = metrics.generate_report()
+
+        pd.testing.assert_frame_equal(
+            threaded.distribution_metrics, serial.distribution_metrics
+        )
+        assert threaded.correlation_metrics == serial.correlation_metrics
+        assert threaded.information_loss_metrics == serial.information_loss_metrics
+        assert threaded.overall_utility_score == serial.overall_utility_score
+
     def test_report_get_summary(self):
         """Test report summary generation."""
         df = pd.DataFrame({"age": [20, 30, 40]})
@@ -409,34 +757,16 @@ class TestReportGeneration:
         assert "Overall Utility Score" in summary
         assert "%" in summary
 
-    def test_report_with_poor_utility(self):
+    def test_report_with_poor_utility(self, metrics_poor):
         """Test report generation with poor utility."""
-        df1 = pd.DataFrame(
-            {
-                "age": [20, 30, 40, 50, 60],
-                "income": [30000, 50000, 70000, 90000, 110000],
-            }
-        )
-        df2 = pd.DataFrame(
-            {
-                "age": [100, 100, 100, 100, 100],  # All same
-                "income": [0, 0, 0, 0, 0],  # All same
-            }
-        )
-
-        metrics = UtilityMetrics(df1, df2)
-        report = metrics.generate_report()
+        report = metrics_poor.generate_report()
 
         assert report.overall_utility_score < 50  # Poor score
         assert len(report.recommendations) > 0
 
-    def test_recommendations_generated(self):
+    def test_recommendations_generated(self, metrics_poor):
         """Test that recommendations are generated."""
-        df1 = pd.DataFrame({"age": [20, 30, 40, 50, 60]})
-        df2 = pd.DataFrame({"age": [100, 100, 100, 100, 100]})
-
-        metrics = UtilityMetrics(df1, df2)
-        report = metrics.generate_report()
+        report = metrics_poor.generate_report()
 
         assert len(report.recommendations) > 0
         # Should recommend less aggressive anonymization
@@ -464,6 +794,54 @@ class TestConvenienceFunction:
 
         assert "a" in report.information_loss_metrics
 
+    def test_compare_utility_disk_cache(self, tmp_path):
+        """Test that reports are persisted and reused for identical inputs."""
+        df1 = pd.DataFrame({"age": [20, 30, 40], "income": [1, 5, 3]})
+        df2 = pd.DataFrame({"age": [21, 31, 41], "income": [1, 5, 3]})
+
+        report = compare_utility(df1, df2, cache_dir=tmp_path)
+        cached_files = list(tmp_path.glob("*.pkl"))
+        assert len(cached_files) == 1
+
+        cached = compare_utility(df1, df2, cache_dir=tmp_path)
+        assert cached.overall_utility_score == report.overall_utility_score
+        assert cached.distribution_metrics.equals(report.distribution_metrics)
+        assert list(tmp_path.glob("*.pkl")) == cached_files
+
+        # Different inputs or column selections get their own entry
+        compare_utility(df1, df1, cache_dir=tmp_path)
+        compare_utility(df1, df2, columns=["age"], cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.pkl"))) == 3
+
+    def test_compare_utility_disk_cache_ignores_stale_entries(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that unreadable reports are recomputed and keys are versioned."""
+        import pickle
+
+        import src.utility_metrics as utility_metrics
+
+        df1 = pd.DataFrame({"age": [20, 30, 40], "income": [1, 5, 3]})
+        df2 = pd.DataFrame({"age": [21, 31, 41], "income": [1, 5, 3]})
+
+        report = compare_utility(df1, df2, cache_dir=tmp_path)
+        (cache_file,) = tmp_path.glob("*.pkl")
+
+        # A truncated or foreign pickle counts as a cache miss
+        cache_file.write_bytes(b"not a pickle")
+        recomputed = compare_utility(df1, df2, cache_dir=tmp_path)
+        assert recomputed.overall_utility_score == report.overall_utility_score
+        assert isinstance(pickle.loads(cache_file.read_bytes()), UtilityReport)
+
+        # Bumping the cache version moves reports to a new key
+        monkeypatch.setattr(
+            utility_metrics,
+            "_REPORT_CACHE_VERSION",
+            utility_metrics._REPORT_CACHE_VERSION + 1,
+        )
+        compare_utility(df1, df2, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
 
 class TestEdgeCases:
     """Test edge cases."""
@@ -496,6 +874,62 @@ class TestEdgeCases:
         with pytest.raises(UtilityMetricsError):
             metrics.calculate_distribution_preservation("value")
 
+        # Fails before the anonymized side is converted
+        assert metrics._anonymized_matrix is None
+
+    def test_list_valued_column_skipped_in_report(self):
+        """Test that unhashable (list-valued) columns don't break the report."""
+        df1 = pd.DataFrame({"history": [[1, 2]] * 5, "value": [1, 2, 3, 4, 5]})
+        df2 = pd.DataFrame({"history": [["US"]] * 5, "value": [1, 2, 3, 4, 5]})
+
+        metrics = UtilityMetrics(df1, df2)
+        report = metrics.generate_report()
+
+        assert list(report.information_loss_metrics) == ["value"]
+        with pytest.raises(UtilityMetricsError, match="unhashable"):
+            metrics.calculate_information_loss("history")
+
+    def test_all_nan_anonymized_column(self):
+        """Test with column that's all NaN only after anonymization."""
+        df1 = pd.DataFrame({"value": [1.0, 2.0, 3.0]})
+        df2 = pd.DataFrame({"value": [np.nan, np.nan, np.nan]})
+
+        metrics = UtilityMetrics(df1, df2)
+
+        with pytest.raises(UtilityMetricsError):
+            metrics.calculate_distribution_preservation("value")
+
+
+@pytest.fixture(scope="module")
+def benchmark_dfs():
+    """100k-row original frame and a generalized copy for benchmarking."""
+    rng = np.random.default_rng(42)
+    n = 100_000
+    df1 = pd.DataFrame(
+        {
+            "age": rng.integers(18, 90, n),
+            "income": rng.normal(50000, 15000, n),
+            "score": rng.normal(75, 10, n),
+            "zip": rng.choice(["10001", "60601", "94105"], n),
+        }
+    )
+    df2 = df1.assign(age=df1["age"] // 10 * 10, income=df1["income"].round(-3))
+    return df1, df2
+
+
+@requires_benchmark
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestPerformance:
+    """Benchmarks guarding the KS and entropy pipeline against regressions."""
+
+    def test_benchmark_compare_utility(self, benchmark, benchmark_dfs):
+        """Benchmark a full utility comparison on 100k rows."""
+        report = benchmark(compare_utility, *benchmark_dfs)
+
+        assert len(report.distribution_metrics) == 3
+        assert list(report.information_loss_metrics) == list(benchmark_dfs[0].columns)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])